@@ -1,27 +1,29 @@
-import sys
-import statistics
+from array import array
 
-day = 4
+from ec.selection import median_low
 
-if len(sys.argv) != 3:
-    print("invalid command")
-    exit()
-part = int(sys.argv[1])
-sort = sys.argv[2]
-    
-filename = 'input/day{0:02d}/p{1}-{2}.txt'.format(day, part, sort)
-with open(filename, 'r') as file:
-    data = [line.strip() for line in file]
+day = 4
 
+def read_nails(lines):
+    """
+    Nail heights as an array('q'). `lines` can be any iterable of lines,
+    e.g. an open file, so a large input is never held as a list of strings.
+    """
+    return array('q', (int(line) for line in lines if line.strip()))
 
-nails = [int(d) for d in data]
+def level(nails, part):
+    """Strikes needed to bring all nails to the same height."""
+    if part != 3:
+        # nails can only be driven down, so the lowest one is the target
+        return sum(nails) - min(nails) * len(nails)
+    # any height between the two middle nails gives the same total
+    target = median_low(nails)
+    return sum(abs(d - target) for d in nails)
 
-target = 0
-if part != 3:
-    target = min(nails)
-else:
-    target = statistics.median(nails)
-    
-depths = [abs(d - target) for d in nails]
+def level_file(path, part):
+    """Streaming variant of `solve` that reads the nails straight from a file."""
+    with open(path) as file:
+        return level(read_nails(file), part)
 
-print('Part {0}: {1}'.format(part, int(sum(depths))))
\ No newline at end of file
+def solve(part, data, sort='real'):
+    return level(read_nails(data), part)
@@ -1,19 +1,7 @@
-from collections import defaultdict
-import math
-import sys
+from collections import defaultdict, deque
 
 day = 5
 
-if len(sys.argv) != 3:
-    print("invalid command")
-    exit()
-part = int(sys.argv[1])
-sort = sys.argv[2]
-    
-filename = 'input/day{0:02d}/p{1}-{2}.txt'.format(day, part, sort)
-with open(filename, 'r') as file:
-    data = [line.strip().split(' ') for line in file]
-
 def print_cols(cs):
     cc = len(cs)
     rows = max([len(c) for c in cs])
@@ -26,66 +14,86 @@ def print_cols(cs):
                 row.append(' ')
         print(' '.join(row))
 
-column_count = len(data[0])
-
-cols = []
-for c in range(column_count):
-    cols.append([])
-
-for r in range(len(data)):
-    for i, v in enumerate(data[r]):
-        cols[i].append(int(v))
-
-def get_top_number(cs):
-    top_row = 0
-    for c in cols:
-        factor = pow(10, 1+math.floor(math.log10((c[0]))))
-        top_row = top_row * factor + c[0]
-    
-    return top_row
-    
-def do_round(round, cs):
+def get_top_number(heads):
+    return int(''.join(heads))
+
+def do_round(round, cs, heads):
+    """
+    One dance step on deque columns. `heads` holds the front number of every
+    column as a string and is updated for the two columns that change.
+    """
+    column_count = len(cs)
     col_start = round % column_count
-    number = cs[col_start].pop(0)
+    number = cs[col_start].popleft()
     col_walking = (col_start+1) % column_count
     col_length = len(cs[col_walking])
     number_place = (number-1) % (2*col_length)
-    
+
     if number_place < col_length:
         cs[col_walking].insert(number_place, number)
     else:
         place = 2*col_length - number_place
         cs[col_walking].insert(place, number)
+
+    heads[col_start] = str(cs[col_start][0])
+    heads[col_walking] = str(cs[col_walking][0])
     return cs
-        
-
-if part == 1:
-    for round in range(10):
-        cols = do_round(round, cols)
-    print(get_top_number(cols))
-    
-elif part == 2:
-    round = 0
-    numbers = defaultdict(int)
-    while True:
-        cols = do_round(round, cols)
-        round = round + 1
-        top_num = get_top_number(cols)
-        numbers[top_num] += 1
-        if numbers[top_num] == 2024:
-            break
-
-    print(top_num * round)
-    
-else:
-
-    round = 0
-    highest = 0
-    while True:
-        cols = do_round(round, cols)
-        round += 1
-        top_num = get_top_number(cols)
-        if top_num > highest:
-            highest = top_num
-            print(highest)
-    
+
+
+def solve(part, data, sort='real'):
+    data = [line.split(' ') for line in data]
+    column_count = len(data[0])
+
+    cols = []
+    for c in range(column_count):
+        cols.append(deque())
+
+    for r in range(len(data)):
+        for i, v in enumerate(data[r]):
+            cols[i].append(int(v))
+
+    heads = [str(c[0]) for c in cols]
+
+    if part == 1:
+        for round in range(10):
+            cols = do_round(round, cols, heads)
+        return get_top_number(heads)
+
+    elif part == 2:
+        round = 0
+        numbers = defaultdict(int)
+        while True:
+            cols = do_round(round, cols, heads)
+            round = round + 1
+            top_num = get_top_number(heads)
+            numbers[top_num] += 1
+            if numbers[top_num] == 2024:
+                break
+
+        return top_num * round
+
+    else:
+
+        # The dance is deterministic, so once a configuration comes back at
+        # the same column the rounds repeat forever and every number that
+        # can be shouted has been seen. Brent's cycle detection only keeps
+        # one earlier configuration: it is replaced at every power of two
+        # steps, and once the configuration comes back to it the whole
+        # cycle has been danced.
+        round = 0
+        highest = 0
+        saved = tuple(tuple(c) for c in cols)
+        power = steps = 1
+        while True:
+            for _ in range(column_count):
+                cols = do_round(round, cols, heads)
+                round += 1
+                highest = max(highest, get_top_number(heads))
+            state = tuple(tuple(c) for c in cols)
+            if state == saved:
+                return highest
+            if steps == power:
+                saved = state
+                power *= 2
+                steps = 0
+            steps += 1
@@ -1,42 +1,46 @@
-from collections import defaultdict
-import sys
-from copy import deepcopy
+from collections import Counter, defaultdict, deque
 
 day = 6
 
-if len(sys.argv) != 3:
-    print("invalid command")
-    exit()
-part = int(sys.argv[1])
-sort = sys.argv[2]
-    
-filename = 'input/day{0:02d}/p{1}-{2}.txt'.format(day, part, sort)
-with open(filename, 'r') as file:
-    data = [line.strip() for line in file]
+def walk_tree(bs, root='RR'):
+    """
+    Breadth first walk from the root that keeps a parent pointer per branch
+    instead of whole paths. Returns the parent pointers and, per depth, the
+    branches that carry a fruit at that depth.
 
-branches = { d.split(':')[0]: d.split(':')[1].split(',') for d in data }
+    In a tree every branch has exactly one parent. Branches that show up
+    more than once (the ANT and BUG pests, which also loop back on
+    themselves) are not part of the tree and are skipped.
+    """
+    occurrences = Counter(n for nexts in bs.values() for n in nexts)
+    parent = {root: None}
+    fruits = defaultdict(list)
+    queue = deque([(root, 1)])
+    while queue:
+        node, depth = queue.popleft()
+        for n in bs[node]:
+            if n == '@':
+                fruits[depth + 1].append(node)
+            elif n in bs and n not in parent and occurrences[n] == 1:
+                parent[n] = node
+                queue.append((n, depth + 1))
+    return parent, fruits
 
-def walk_tree(path_up_to_now, bs):
-    last_in_path = path_up_to_now[-1]
-    if last_in_path == '@':
-        return [path_up_to_now]
+def path_to(node, parent):
+    path = []
+    while node is not None:
+        path.append(node)
+        node = parent[node]
+    return path[::-1]
 
-    next = bs[last_in_path]
-    all_paths = []
-    for n in next:
-        if n in path_up_to_now:
-            continue
-        if n in bs.keys() or n == '@':
-            putn = deepcopy(path_up_to_now) + [n]
-            all_paths += walk_tree(putn, bs)
-    return all_paths
-paths = walk_tree(['RR'], branches)
-lengths = defaultdict(list)
-for p in paths:
-    lengths[len(p)].append(p)
-branch = [v[0] for k,v in lengths.items() if len(v)==1][0]
+def solve(part, data, sort='real'):
+    branches = { d.split(':')[0]: d.split(':')[1].split(',') for d in data }
 
-if part == 1:
-    print(''.join(branch))
-else:
-    print(''.join([b[0] for b in branch]))
+    parent, fruits = walk_tree(branches)
+    node = [v[0] for k, v in fruits.items() if len(v)==1][0]
+    branch = path_to(node, parent) + ['@']
+
+    if part == 1:
+        return ''.join(branch)
+    else:
+        return ''.join([b[0] for b in branch])
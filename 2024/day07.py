@@ -1,21 +1,7 @@
-from copy import deepcopy
-import itertools
-import sys
+import math
 
 day = 7
 
-if len(sys.argv) != 3:
-    print("invalid command")
-    exit()
-part = int(sys.argv[1])
-sort = sys.argv[2]
-    
-filename = 'input/day{0:02d}/p{1}-{2}.txt'.format(day, part, sort)
-with open(filename, 'r') as file:
-    data = [line.strip() for line in file]
-    
-index = [i for i in range(len(data)) if data[i]=='']
-
 def find_track(field):
     R, C = len(field), len(field[0])
     track = []
@@ -47,93 +33,111 @@ def find_track(field):
     track.insert(0,'S')
     return track
 
-DP = {}
-
-def score_one_loop(step, ops, track):
-    power = 0
-    power_used = 0    
-    key = (step % len(ops), tuple(ops))
-    if key in DP:
-        return DP[key]
-    
-    for s in range(1,len(track)+1):
-        t = track[s%len(track)]
+VALUE = {'+': 1, '-': -1, '=': 0}
+
+def loop_weights(track, plan_length, loops):
+    """
+    Scores the race up to the plan, as (base, weights): a plan scores
+    base + sum(VALUE[op] * weights[i] for i, op in enumerate(plan)).
+
+    Step j (1-based) changes the power by its track segment, or by the plan
+    action (j-1) % plan_length on '=' and 'S', and that change is counted
+    by every step from j to the end, N - j + 1 times. Both the track and the
+    plan repeat after lcm(len(track), plan_length) steps, so one period with
+    the number of times each of its steps comes back is enough.
+    """
+    length = len(track)
+    steps = loops * length
+    period = math.lcm(length, plan_length)
+    base = 10 * steps
+    weights = [0] * plan_length
+    for j in range(1, min(period, steps) + 1):
+        # step j comes back at j + k*period for k < times
+        times = (steps - j) // period + 1
+        weight = times * (steps + 1 - j) - period * times * (times - 1) // 2
+        t = track[j % length]
         if t == '+':
-            power += 1
+            base += weight
         elif t == '-':
-            power -= 1
+            base -= weight
         else:
-            match ops[step % len(ops)]:
-                case '+':
-                    power += 1
-                case '-':
-                    power -= 1
-                case '=':
-                    power = power
-                case _:
-                    assert(False)
-        power_used += power
-        step += 1
-
-    DP[key] = (power_used, power)
-    return (power_used, power)    
+            weights[(j - 1) % plan_length] += weight
+    return base, weights
 
 def score_knight(ops, rounds, track):
-    power = 10
-    power_used = 0
-    step = 0
-    for _ in range(rounds):
-        (pu, p) = score_one_loop(step, ops, track)
-        power_used += pu + power*len(track)
-        power += p
-        step = (step+len(track)) % len(ops)
-    return power_used
+    base, weights = loop_weights(track, len(ops), rounds)
+    return base + sum(VALUE[op] * w for op, w in zip(ops, weights))
 
+def plans(counts):
+    """Yields every distinct arrangement of a multiset given as {item: count}."""
+    items = sorted(counts)
+    left = [counts[item] for item in items]
+    total = sum(left)
+    plan = [None] * total
 
-if part == 1:
-    operations = { d.split(':')[0]: d.split(':')[1].split(',') for d in data }
+    def place(i):
+        if i == total:
+            yield tuple(plan)
+            return
+        for k, item in enumerate(items):
+            if left[k]:
+                left[k] -= 1
+                plan[i] = item
+                yield from place(i + 1)
+                left[k] += 1
 
-    power = { k: 10 for k in operations.keys() }
-    power_used = { k: 0 for k in operations.keys() }
+    yield from place(0)
 
-    for round in range(10):
-        for device, ops in operations.items():
-            match ops[round % len(ops)]:
-                case '+':
-                    power[device] += 1
-                case '-':
-                    power[device] -= 1
-                case '=':
-                    power[device] = power[device]
-                case _:
-                    assert(False)
-            
-            power_used[device] += power[device]
-
-    print(''.join([k for k, v in sorted(power_used.items(), key=lambda item: item[1], reverse=True)]))
-else:
-    assert(len(index) > 0)
-    operations = { d.split(':')[0]: d.split(':')[1].split(',') for d in data[0:index[0]] }
-
-    power = { k: 10 for k in operations.keys() }
-    power_used = { k: 0 for k in operations.keys() }
-        
-    field = data[index[0]+1:]
-    track = find_track(field)
-
-    loops = 10 if part == 2 else 2024
-    for device, ops in operations.items():
-        power_used[device] = score_knight(ops, loops, track)
-    if part == 2:
-        print(''.join([k for k, v in sorted(power_used.items(), key=lambda item: item[1], reverse=True)]))    
+
+
+def solve(part, data, sort='real'):
+    index = [i for i in range(len(data)) if data[i]=='']
+
+    if part == 1:
+        operations = { d.split(':')[0]: d.split(':')[1].split(',') for d in data }
+
+        power = { k: 10 for k in operations.keys() }
+        power_used = { k: 0 for k in operations.keys() }
+
+        for round in range(10):
+            for device, ops in operations.items():
+                match ops[round % len(ops)]:
+                    case '+':
+                        power[device] += 1
+                    case '-':
+                        power[device] -= 1
+                    case '=':
+                        power[device] = power[device]
+                    case _:
+                        assert(False)
+
+                power_used[device] += power[device]
+
+        return ''.join([k for k, v in sorted(power_used.items(), key=lambda item: item[1], reverse=True)])
     else:
-        target_score = power_used['A']
-        
-        count = 0
-        options = set(itertools.permutations('+++++---==='))
-        for i, option in enumerate(options):
-            option_score = score_knight(option, loops, track)
-            if option_score > target_score:
-                count += 1
-        print(count)
+        assert(len(index) > 0)
+        operations = { d.split(':')[0]: d.split(':')[1].split(',') for d in data[0:index[0]] }
+
+        power = { k: 10 for k in operations.keys() }
+        power_used = { k: 0 for k in operations.keys() }
+
+        field = data[index[0]+1:]
+        track = find_track(field)
+
+        loops = 10 if part == 2 else 2024
+        for device, ops in operations.items():
+            power_used[device] = score_knight(ops, loops, track)
+        if part == 2:
+            return ''.join([k for k, v in sorted(power_used.items(), key=lambda item: item[1], reverse=True)])
+        else:
+            target_score = power_used['A']
 
+            # every plan has the same length, so the weights are shared and
+            # scoring a plan is a dot product with its actions
+            base, weights = loop_weights(track, 11, loops)
+            count = 0
+            for option in plans({'+': 5, '-': 3, '=': 3}):
+                option_score = base + sum(VALUE[op] * w for op, w in zip(option, weights))
+                if option_score > target_score:
+                    count += 1
+            return count
@@ -1,53 +1,62 @@
 import math
-import sys
 
 day = 8
 
-if len(sys.argv) != 3:
-    print("invalid command")
-    exit()
-part = int(sys.argv[1])
-sort = sys.argv[2]
-    
-filename = 'input/day{0:02d}/p{1}-{2}.txt'.format(day, part, sort)
-with open(filename, 'r') as file:
-    data = [line.strip() for line in file]
-
-input = int(data[0])
-
 def build_thick_pyramid(supply, priests, acolytes, minimum):
+    """
+    Adds layers until the pyramid uses at least `supply` blocks. Returns the
+    number of missing blocks times the final width, and the column heights.
+
+    Layer k covers the columns at distance k or less from the centre, so
+    the thicknesses are the differences between neighbouring column heights
+    and the heights are only summed up once, at the end.
+    """
     thickness = 1
     width = 1
-    blocks = [1]
-    heights = [1]
-    while sum(blocks) < supply:
+    total = 1
+    thicknesses = [1]
+    while total < supply:
         thickness = (thickness * priests) % acolytes + minimum
-        heights = [thickness] + [ (h + thickness) for h in heights ] + [thickness]
         width += 2
-        blocks.append(thickness * width)
-    return (sum(blocks) - supply) * width, heights
-
-
-if part == 1:
-    w = math.ceil(math.sqrt(input))
-    width = w**2 - (w-1)**2
-    required = (w)**2 - input
-
-    print(required * width)
-elif part == 2:
-    supply = 50 if sort == "test" else 20240000
-    priests = input
-    acolytes = 5 if sort == "test" else 1111
-    result, _ = build_thick_pyramid(supply, priests, acolytes, 0)
-    print(result)
-    
-else:
-    supply = 160 if sort == "test" else 202400000
-    priests = input
-    acolytes = 5 if sort == "test" else 10
-    result, heights = build_thick_pyramid(supply, priests, acolytes, acolytes)
-    
-    width = len(heights)
-    to_be_removed = [(priests * width * h) % acolytes for h in heights[1:-1]]
-
-    print(sum(heights) - sum(to_be_removed) - supply)
+        total += thickness * width
+        thicknesses.append(thickness)
+    return (total - supply) * width, column_heights(thicknesses)
+
+
+def column_heights(thicknesses):
+    """Heights from the left edge to the right edge for the layer thicknesses."""
+    outer = []
+    height = 0
+    for thickness in reversed(thicknesses):
+        height += thickness
+        outer.append(height)
+    return outer + outer[-2::-1]
+
+
+def solve(part, data, sort='real'):
+    input = int(data[0])
+
+    if part == 1:
+        w = math.ceil(math.sqrt(input))
+        width = w**2 - (w-1)**2
+        required = (w)**2 - input
+
+        return required * width
+    elif part == 2:
+        supply = 50 if sort == "test" else 20240000
+        priests = input
+        acolytes = 5 if sort == "test" else 1111
+        result, _ = build_thick_pyramid(supply, priests, acolytes, 0)
+        return result
+
+    else:
+        supply = 160 if sort == "test" else 202400000
+        priests = input
+        acolytes = 5 if sort == "test" else 10
+        result, heights = build_thick_pyramid(supply, priests, acolytes, acolytes)
+
+        # the hollow is only needed for the finished pyramid
+        width = len(heights)
+        to_be_removed = [(priests * width * h) % acolytes for h in heights[1:-1]]
+
+        return sum(heights) - sum(to_be_removed) - supply
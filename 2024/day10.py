@@ -1,21 +1,11 @@
-from collections import defaultdict
+from collections import defaultdict, deque
 from copy import deepcopy
 from collections import Counter
 from itertools import product
 from math import prod
-import sys
 
 day = 10
 
-if len(sys.argv) != 3:
-    print("invalid command")
-    exit()
-part = int(sys.argv[1])
-sort = sys.argv[2]
-    
-filename = 'input/day{0:02d}/p{1}-{2}.txt'.format(day, part, sort)
-with open(filename, 'r') as file:
-    data = [list(line.strip()) for line in file]
 
 def base_power(ch):
     return 1 + ord(ch) - ord('A')
@@ -79,9 +69,6 @@ def determine_runic_word(d):
 
 def effective_power(rw):
     return sum([base_power(ch) * (i+1) for i, ch in enumerate(rw)])
-    
-    
-runic_word = determine_runic_word(data)
 
 def select_rune(r, c, d):
     return [ [d[9*r+i][9*c+j] for j in range(8)] for i in range(8) ]
@@ -108,54 +95,64 @@ def fill_in(data, r, c, unknown):
             d[row][i] = ch
     return d
 
-if part == 1:
-    print('Part {}: {}'.format(part, runic_word[0]))
-if part == 2:
-    total = 0
-    R = int((len(data)+1)/9)
-    C = int((len(data[0])+1)/9)
-    for r in range(R):
-        for c in range(C):
-            total += effective_power(determine_runic_word(select_rune(r,c,data))[0])
-    print('Part {}: {}'.format(part, total))
-if part == 3:
-    total = 0
-    R = int((len(data)-2)/6)
-    C = int((len(data[0])-2)/6)
-    done = False
-    while not done:
-        all_options = defaultdict(list)
+
+def windows(x, y, R, C):
+    """The compact runesets whose 8x8 window contains cell (x, y)."""
+    rows = [r for r in (x // 6 - 1, x // 6) if 0 <= r < R and 6*r <= x < 6*r+8]
+    cols = [c for c in (y // 6 - 1, y // 6) if 0 <= c < C and 6*c <= y < 6*c+8]
+    return product(rows, cols)
+
+
+def solve(part, data, sort='real'):
+    data = [list(line) for line in data]
+
+    if part == 1:
+        return determine_runic_word(data)[0]
+    if part == 2:
+        total = 0
+        R = int((len(data)+1)/9)
+        C = int((len(data[0])+1)/9)
         for r in range(R):
             for c in range(C):
-                sub_data = select_compact_runeset(r, c, data)
-                rw, recovered, runes = determine_runic_word(sub_data)
-
-                for i in range(4):
-                    for j in range(4):
-                        if runes[i][j] != '.':
-                            x, y = 6*r+i+2, 6*c+j+2
-                            data[x][y] = runes[i][j]
-                            
-                for pos, options in recovered.items():
-                    i, j = pos
-                    x, y = 6*r+i, 6*c+j
-                    all_options[(x,y)].append(set(options))
-                
-        filled_in = False
-        for pos, lst in all_options.items():
-            filtered_lst = [l for l in lst if len(l) == 1]
-            if len(filtered_lst) > 0:
-                data[pos[0]][pos[1]] = list(filtered_lst[0])[0]
-                filled_in = True
-
-        done = not filled_in
-
-    for r in range(R):
-        for c in range(C):
+                total += effective_power(determine_runic_word(select_rune(r,c,data))[0])
+        return total
+    if part == 3:
+        total = 0
+        R = int((len(data)-2)/6)
+        C = int((len(data[0])-2)/6)
+        # a filled in '?' can only help the runesets whose 8x8 window
+        # contains it, so only those are looked at again
+        queue = deque(product(range(R), range(C)))
+        queued = set(queue)
+        while queue:
+            r, c = queue.popleft()
+            queued.discard((r, c))
             sub_data = select_compact_runeset(r, c, data)
-            rw, _, _ = determine_runic_word(sub_data)
-            if '.' not in rw:
-                ep = effective_power(rw)
-                total += ep
+            rw, recovered, runes = determine_runic_word(sub_data)
+
+            for i in range(4):
+                for j in range(4):
+                    if runes[i][j] != '.':
+                        x, y = 6*r+i+2, 6*c+j+2
+                        data[x][y] = runes[i][j]
+
+            for pos, options in recovered.items():
+                i, j = pos
+                x, y = 6*r+i, 6*c+j
+                options = set(options)
+                if len(options) == 1 and data[x][y] == '?':
+                    data[x][y] = options.pop()
+                    for key in windows(x, y, R, C):
+                        if key not in queued:
+                            queued.add(key)
+                            queue.append(key)
+
+        for r in range(R):
+            for c in range(C):
+                sub_data = select_compact_runeset(r, c, data)
+                rw, _, _ = determine_runic_word(sub_data)
+                if '.' not in rw:
+                    ep = effective_power(rw)
+                    total += ep
 
-    print('Part {}: {}'.format(part, total))
+        return total
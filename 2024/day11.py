@@ -1,48 +1,56 @@
-from collections import defaultdict
-from copy import deepcopy
-import sys
+from operator import mul
 
 day = 11
 
-if len(sys.argv) != 3:
-    print("invalid command")
-    exit()
-part = int(sys.argv[1])
-sort = sys.argv[2]
-    
-filename = 'input/day{0:02d}/p{1}-{2}.txt'.format(day, part, sort)
-with open(filename, 'r') as file:
-    data = [line.strip() for line in file]
+def transitions(rules):
+    """
+    The rules as an integer matrix over the species, in the order of
+    `rules`: matrix[a][b] is the number of termites of species b that one
+    termite of species a turns into in a day.
+    """
+    index = {species: i for i, species in enumerate(rules)}
+    matrix = [[0] * len(index) for _ in index]
+    for species, children in rules.items():
+        row = matrix[index[species]]
+        for child in children:
+            row[index[child]] += 1
+    return matrix
 
-rules = [line.split(':') for line in data]
-rules = { rule[0]: rule[1].split(',') for rule in rules}
+def multiply(a, b):
+    columns = list(zip(*b))
+    return [[sum(map(mul, row, column)) for column in columns] for row in a]
 
-def day(p):
-    new_population = defaultdict(int)
+def populations(rules, days):
+    """
+    The number of termites after `days` days, starting from one of each
+    species. The day matrix is squared once per bit of `days`, and the
+    counts only pick up the squares for the bits that are set. Squaring
+    costs as much as one step per species, so the last few steps are
+    taken one at a time.
+    """
+    matrix = transitions(rules)
+    counts = [1] * len(matrix)
+    while days:
+        if days < len(matrix):
+            for _ in range(days):
+                counts = [sum(map(mul, row, counts)) for row in matrix]
+            break
+        if days & 1:
+            counts = [sum(map(mul, row, counts)) for row in matrix]
+        days >>= 1
+        if days:
+            matrix = multiply(matrix, matrix)
+    return dict(zip(rules, counts))
 
-    for species, count in p.items():    
-        rule = rules[species]
-        for s in rule:
-            new_population[s] += count
-    
-    return new_population
 
+def solve(part, data, sort='real'):
+    rules = [line.split(':') for line in data]
+    rules = { rule[0]: rule[1].split(',') for rule in rules}
 
-if part == 1:
-    population = {'A': 1 }
-    for _ in range(4):
-        population = day(population)
-    print(sum([v for v in population.values()]))
-elif part == 2:
-    population = {'Z': 1 }
-    for _ in range(10):
-        population = day(population)
-    print(sum([v for v in population.values()]))
-else:
-    populations = {species: defaultdict(int) for species in rules.keys()}
-    for species in populations.keys():
-        populations[species][species] = 1
-        for generation in range(20):
-            populations[species] = day(populations[species])
-    pop_sizes = [sum([v for v in pop.values()]) for pop in populations.values()]
-    print(max(pop_sizes) - min(pop_sizes))
\ No newline at end of file
+    if part == 1:
+        return populations(rules, 4)['A']
+    elif part == 2:
+        return populations(rules, 10)['Z']
+    else:
+        pop_sizes = populations(rules, 20).values()
+        return max(pop_sizes) - min(pop_sizes)
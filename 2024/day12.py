@@ -1,99 +1,88 @@
 from collections import defaultdict
-import sys
 
 day = 12
 
-if len(sys.argv) != 3:
-    print("invalid command")
-    exit()
-part = int(sys.argv[1])
-sort = sys.argv[2]
-    
-filename = 'input/day{0:02d}/p{1}-{2}.txt'.format(day, part, sort)
-with open(filename, 'r') as file:
-    data = [line.strip() for line in file]
 
-if part != 3:
-    base = len(data)-2
-    towers = defaultdict(list)
-    catapults = defaultdict(tuple)
-    for i, line in enumerate(data):
-        for j, ch in enumerate(line):
-            match ch:
-                case 'A'|'B'|'C':
-                    catapults[ch] = (base-i,j)
-                case 'T'|'H':
-                    towers[ch].append((base-i,j))
-                case _:
-                    continue
+def intercept(meteor, max_time, max_dist):
+    """
+    Ranking value (segment number times power) of the earliest shot that
+    hits `meteor`, given as (height, distance), or None if nothing can.
 
-    total = 0
-    for tt, twrs in towers.items():
-        for tower in twrs:
-            for segment, catapult in catapults.items():
-                dr, dc = tower[0]-catapult[0], tower[1]-catapult[1]
-                pp = (dr+dc)/3
-                if int(pp)==pp:
-                    sgmnum = ord(segment)-ord('A')+1
-                    factor = 1 if tt == 'T' else 2
-                    total += int(factor * (sgmnum * pp))
-    print(total)
+    A projectile is in column x at time x whatever its segment or power, so
+    a meteor at time t can only be met by a shot fired t - x >= 0 ticks
+    late, i.e. in a column x <= distance // 2. Along the meteor's path the
+    height is x + d for a fixed d, and for segment s the power that hits
+    column x follows from the phase: rising when d == s (power x), flat
+    when x >= 2(s - d) (power x + d - s) and falling when
+    (s - d) / 2 <= x < 2(s - d) and 2x + d - s is a multiple of 3. The
+    earliest hit is the largest such column.
+    """
+    height, distance = meteor
+    d = height - distance
+    # the meteor is on the ground in column -d, and powers stop below max_time
+    low = max(0, -d)
+    high = min(distance // 2, max_dist - 1)
+    hits = {}
+    for s in range(3):
+        candidates = []
+        if d == s:
+            candidates.append((min(high, max_time - 1), 0))
+        if d <= s:
+            x = min(high, max_time - 1 - d + s)
+            if x >= 2 * (s - d):
+                candidates.append((x, d - s))
+        x = min(high, 2 * (s - d) - 1, (3 * (max_time - 1) - d + s) // 2)
+        x -= (x - 2 * (s - d)) % 3
+        if 2 * x + d - s >= 0:
+            candidates.append((x, None))
+        for x, offset in candidates:
+            if x < low:
+                continue
+            power = x + offset if offset is not None else (2 * x + d - s) // 3
+            hits.setdefault(x, []).append((s + 1) * power)
+    if not hits:
+        return None
+    return min(hits[max(hits)])
 
-else:
-    
-    def key_of_min(d):
-        return min(d, key = d.get)
-    
-    meteors = [[int(x) for x in line.split(' ')] for line in data]
-    meteors = [ (meteor[1], meteor[0]) for meteor in meteors]
-    
-    def get_positions_projectile(start_pos, power):
-        positions = [start_pos]
-        positions += [(start_pos[0]+p, start_pos[1]+p) for p in range(1,power+1)]
-        positions += [(positions[power][0], positions[power][1]+p) for p in range(1, power+1)]
-        positions += [(positions[2*power][0]-p, positions[2*power][1]+p) for p in range(1, positions[2*power][0]+1)]
-        return positions
 
-    def get_positions_meteor(start_pos):
-        return [(start_pos[0]-p, start_pos[1]-p) for p in range(start_pos[0]+1)]
+def solve(part, data, sort='real'):
+    if part != 3:
+        base = len(data)-2
+        towers = defaultdict(list)
+        catapults = defaultdict(tuple)
+        for i, line in enumerate(data):
+            for j, ch in enumerate(line):
+                match ch:
+                    case 'A'|'B'|'C':
+                        catapults[ch] = (base-i,j)
+                    case 'T'|'H':
+                        towers[ch].append((base-i,j))
+                    case _:
+                        continue
 
-    max_time = max([meteor[0] for meteor in meteors])
-    max_dist = max([meteor[1] for meteor in meteors])
+        total = 0
+        for tt, twrs in towers.items():
+            for tower in twrs:
+                for segment, catapult in catapults.items():
+                    dr, dc = tower[0]-catapult[0], tower[1]-catapult[1]
+                    pp = (dr+dc)/3
+                    if int(pp)==pp:
+                        sgmnum = ord(segment)-ord('A')+1
+                        factor = 1 if tt == 'T' else 2
+                        total += int(factor * (sgmnum * pp))
+        return total
 
-    pp = defaultdict(dict)
-    for segment, projectile in {'A':[0,0], 'B':[1,0], 'C':[2,0]}.items():
-        for power in range(max_time):
-            # if power % 1000 == 0:
-            #     print(power)
-            gpp = get_positions_projectile(projectile, power)
-            for t, x in enumerate(gpp):
-                if x[1] < max_dist:
-                    if t not in pp[tuple(x)].keys():
-                        pp[tuple(x)][t] = set()
-                    pp[tuple(x)][t].add((segment,power))
-                    # stronger = [i for i in pp[tuple(x)][t] if i[0] == segment and i[1] > power]
-                    # if len(stronger) == 0:
-                    #     # remove all elements from set that are this segment
-                    #     pp[tuple(x)][t] = {i for i in pp[tuple(x)][t] if i[0] != segment}
-                    #     pp[tuple(x)][t].add((segment,power))
+    else:
+        meteors = [[int(x) for x in line.split(' ')] for line in data]
+        meteors = [ (meteor[1], meteor[0]) for meteor in meteors]
 
-    total_score = 0
-    for meteor in meteors:
-        mps = get_positions_meteor(meteor)
-        options = []
-        for t, m in enumerate(mps):
-            key = tuple(m)
-            if key in pp:
-                in_time = [pp[key] for tt, power in pp[key].items() if t >= tt]
-                if len(in_time) > 0:
-                    for lst in in_time[0].values():
-                        mins = {'A': 10**9, 'B': 10**9, 'C': 10**9 }
-                        for s, p in lst:
-                            if mins[s] > p:
-                                mins[s] = p
-                        total_score += min([(ord(s)-ord('A')+1) * p for s,p in mins.items() if p < 10**9])
-                    break
-                else:                  
-                    continue
-                
-    print(total_score)
\ No newline at end of file
+        max_time = max([meteor[0] for meteor in meteors])
+        max_dist = max([meteor[1] for meteor in meteors])
+
+        total_score = 0
+        for meteor in meteors:
+            rank = intercept(meteor, max_time, max_dist)
+            if rank is not None:
+                total_score += rank
+
+        return total_score
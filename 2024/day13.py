@@ -1,67 +1,56 @@
-from collections import defaultdict
-import sys
+from ec.graph import dijkstra
+from ec.grid import Grid
 
 day = 13
 
-if len(sys.argv) != 3:
-    print("invalid command")
-    exit()
-part = int(sys.argv[1])
-sort = sys.argv[2]
-    
-filename = 'input/day{0:02d}/p{1}-{2}.txt'.format(day, part, sort)
-with open(filename, 'r') as file:
-    data = [line.strip() for line in file]
-
 directions = [(0, -1), (1, 0), (0, 1), (-1, 0)]
-height = defaultdict(lambda: float('inf'))
-end = []
-for j, line in enumerate(data):
-    for i, ch in enumerate(line):
-        match ch:
-            case '#':
-                height[(i, j)] = float('inf')
-            case ' ':
+
+WALL = 255
+
+def parse(data):
+    """
+    Returns a height grid (walls and empty space are WALL), the start index
+    and the list of end indices.
+    """
+    grid = Grid.from_lines(data, fill=ord('#'))
+    height = Grid(grid.width, grid.height, WALL)
+    start = None
+    end = []
+    for i in grid.indices():
+        match chr(grid[i]):
+            case '#' | ' ':
                 continue
             case 'E':
-                start = (i, j)
-                height[start] = 0
+                start = i
+                height[i] = 0
             case 'S':
-                end.append((i, j))
-                height[(i, j)] = 0
-            case _: 
-                height[(i, j)] = int(ch)
-                
-def get_neighbors(pos):
-    x, y = pos
-    return [(x + dx, y + dy) for dx, dy in directions if height[(x + dx, y + dy)] != float('inf')]
+                end.append(i)
+                height[i] = 0
+            case ch:
+                height[i] = int(ch)
+    return height, start, end
 
-def shortest_path(start, end):
-    queue = [start]
-    distance = defaultdict(lambda: float('inf'))
-    distance[start] = 0
-    # previous = {}
+def get_neighbors(pos, height):
+    return [pos + o for o in height.offsets(directions) if height[pos + o] != WALL]
+
+def climb_cost(height):
+    """Edge cost: height difference on a wheel of 10 levels, plus the step itself."""
+    def cost(pos, neighbor):
+        d = abs(height[pos] - height[neighbor])
+        return min(d, 10 - d) + 1
+    return cost
+
+def shortest_path(start, end, height):
+    # the cost is symmetric, so search from all ends at once towards the start
+    if start is None or not end:
+        raise ValueError('the map needs an E and at least one S')
+    found = dijkstra(end, lambda pos: get_neighbors(pos, height), climb_cost(height), [start])
+    if found is None:
+        raise ValueError('E cannot be reached from any S')
+    distance, _ = found
+    return distance
 
-    while queue:
-        queue.sort(key=lambda pos: distance[pos])
-        x, y = queue.pop(0)
-        if (x, y) in end:
-            return distance[(x,y)] #, previous
-        for neighbor in get_neighbors((x, y)):
-            current_height = height[(x, y)]
-            neighbor_height = height[neighbor]
-            distance_to_neighbor = abs(current_height - neighbor_height)
-            if 10 - distance_to_neighbor < distance_to_neighbor:
-                distance_to_neighbor = 10 - distance_to_neighbor
-            
-            distance_to_neighbor = distance_to_neighbor + 1
-            if distance[neighbor] == float('inf') or distance[(x, y)] + distance_to_neighbor <= distance[neighbor]:
-                # previous[neighbor] = (x, y)
-                distance[neighbor] = distance[(x, y)] + distance_to_neighbor
-                if neighbor not in queue:
-                    queue.append(neighbor)
 
-                
 def get_path(previous, start, end):
     path = []
     current = end
@@ -71,16 +60,8 @@ def get_path(previous, start, end):
     path.append(start)
     return path[::-1]
 
-# distance, previous = shortest_path(start, end)
-distance = shortest_path(start, end)
-print('Part {}: {}'.format(part, distance))
-
-if False:
-    path = get_path(previous, start, end)
-    grid = [[str(height[(j,i)]) if height[(j,i)] != float('inf') else data[i][j] for j in range(len(data[0]))] for i in range(len(data))]
-    for x, y in path:
-        grid[y][x] = 'X'
-    grid[start[1]][start[0]] = 'S'
-    grid[end[1]][end[0]] = 'E'
-    for line in grid:
-        print(''.join(line))
+def solve(part, data, sort='real'):
+    height, start, end = parse(data)
+    # distance, previous = shortest_path(start, end, height)
+    distance = shortest_path(start, end, height)
+    return distance
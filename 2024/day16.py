@@ -1,41 +1,31 @@
-from collections import defaultdict
 from functools import reduce
-import itertools
 from math import gcd
-import sys
 
 day = 16
 
-if len(sys.argv) != 3:
-    print("invalid command")
-    exit()
-part = int(sys.argv[1])
-sort = sys.argv[2]
-    
-filename = 'input/day{0:02d}/p{1}-{2}.txt'.format(day, part, sort)
-with open(filename, 'r') as file:
-    data = [line for line in file]
+# the roll columns are aligned with leading spaces, so keep them
+strip_input = False
 
-turns = [int(d) for d in data[0].split(',')]
+def parse(data):
+    turns = [int(d) for d in data[0].split(',')]
 
-number_of_rolls = len(turns)
+    number_of_rolls = len(turns)
 
-rolls = [[] for i in range(number_of_rolls)]
+    rolls = [[] for i in range(number_of_rolls)]
 
-symbols = set()
+    symbols = set()
 
-for roll_number in range(number_of_rolls):
-    for i in range(2, len(data)):
-        code = data[i][4*roll_number:4*roll_number+3]
-        if ' ' not in code and len(code)==3:
-            symbols = symbols.union(set(code))
-            rolls[roll_number].append(code)
+    for roll_number in range(number_of_rolls):
+        for i in range(2, len(data)):
+            code = data[i][4*roll_number:4*roll_number+3]
+            if ' ' not in code and len(code)==3:
+                symbols = symbols.union(set(code))
+                rolls[roll_number].append(code)
+    return turns, rolls, symbols
 
-current_positions = [0 for i in range(number_of_rolls)]
-
-def get_code(turn):
-    finished_position = [ (turn * turns[i]) % len(rolls[i]) for i in range(number_of_rolls) ]
-    return ' '.join([rolls[i][finished_position[i]] for i in range(number_of_rolls)])
+def get_code(turn, turns, rolls):
+    finished_position = [ (turn * turns[i]) % len(rolls[i]) for i in range(len(rolls)) ]
+    return ' '.join([rolls[i][finished_position[i]] for i in range(len(rolls))])
 
 def lcm(a, b):
     return a * b // gcd(a, b)
@@ -48,64 +38,74 @@ def calculate_min_turns(turns, size_rolls):
     advances = [size_rolls[i] * turns[i] for i in range(len(turns))]
     return reduce(lcm, advances)
 
-def symbol_counts(code, symbol = None):
-    if symbol:
-        return code.count(symbol)
-    else:
-        return [code.count(s) for s in symbols]
-
-def coins_in_turn(turn):
-    return coins_in_code(get_code(turn))
-
-def coins_in_code(code):
-    code = code[::2]
-    sc = symbol_counts(code)
-    triplets = [1 if sc[i] >= 3 else 0 for i in range(len(sc))]
-    extras = [sc[i] - 3 if sc[i] > 3 else 0 for i in range(len(sc))]
-    return sum(triplets) + sum(extras)
-
-def get_code_from_positions(pos):
-    return ' '.join([rolls[i][pos[i] % len(rolls[i])] for i in range(number_of_rolls)])
-
-if part == 1:
-    print('Part {}: {}'.format(part, get_code(100)))
-if part == 2:       
-    total_pulls = 202420242024
-
-    pulls = lcm_of_list([len(r) for r in rolls])    
-    current_coins = 0
-    total_coins = 0
-    for i in range(0, pulls + (total_pulls % pulls)):
-        if i == pulls:
-            total_coins += current_coins * (total_pulls // pulls)
-            current_coins = 0
-        current_coins += coins_in_turn(i)
-    print('Part {}: {}'.format(part, total_coins+current_coins))
-    
-elif part == 3:
-        
-    DP = { 'max': {}, 'min': {} }
-    
-    def get_total_coins(pos, pull, find_func):
-        key = (tuple(pos), pull)
-        if key in DP[find_func.__name__]:
-            return DP[find_func.__name__][key]
-        
-        if pull == 0:
-            return 0
-        
-        options = []
-        for d in [-1,0,1]:
-            new_pos = [ (pos[i] + turns[i] + d) % len(rolls[i]) for i in range(number_of_rolls) ]
-            coins = coins_in_code(get_code_from_positions(new_pos))
-            coins += get_total_coins(new_pos, pull - 1, find_func)
-            options.append(coins)
-        extreme = find_func(options)
-        
-        DP[find_func.__name__][key] = extreme
-        return extreme
-    
-    total_pulls = 256
-    positions = [0 for i in range(number_of_rolls)]
-    
-    print('Part {}: {} {}'.format(part, get_total_coins(positions, total_pulls, max), get_total_coins(positions, total_pulls, min)))
+def eye_table(rolls):
+    """
+    The eyes (first and last character) of every code, as small symbol
+    numbers: eyes[roll][position] is a pair of indices into one count list.
+    Returns the table and the number of different eye symbols.
+    """
+    numbers = {}
+    eyes = []
+    for roll in rolls:
+        eyes.append([(numbers.setdefault(code[0], len(numbers)), numbers.setdefault(code[2], len(numbers))) for code in roll])
+    return eyes, len(numbers)
+
+def coins_at(positions, eyes, symbol_count):
+    """Coins for the rolls stopped at `positions`: every eye beyond two of a kind pays one."""
+    counts = [0] * symbol_count
+    for roll, position in zip(eyes, positions):
+        left, right = roll[position]
+        counts[left] += 1
+        counts[right] += 1
+    return sum(c - 2 for c in counts if c > 2)
+
+def solve(part, data, sort='real'):
+    turns, rolls, symbols = parse(data)
+    number_of_rolls = len(turns)
+
+    if part == 1:
+        return get_code(100, turns, rolls)
+    if part == 2:
+        total_pulls = 202420242024
+
+        eyes, symbol_count = eye_table(rolls)
+        sizes = [len(r) for r in rolls]
+        pulls = lcm_of_list(sizes)
+        current_coins = 0
+        total_coins = 0
+        for i in range(0, pulls + (total_pulls % pulls)):
+            if i == pulls:
+                total_coins += current_coins * (total_pulls // pulls)
+                current_coins = 0
+            positions = [(i * t) % size for t, size in zip(turns, sizes)]
+            current_coins += coins_at(positions, eyes, symbol_count)
+        return total_coins+current_coins
+
+    elif part == 3:
+        total_pulls = 256
+        eyes, symbol_count = eye_table(rolls)
+        sizes = [len(r) for r in rolls]
+
+        # after n pulls every roll has moved n * turn plus the same shift k,
+        # the sum of all the -1/0/+1 nudges, so (n, k) is the whole state;
+        # k runs from -total_pulls to total_pulls and is stored at k + total_pulls
+        width = 2 * total_pulls + 1
+        most = [0] * width
+        least = [0] * width
+        for n in range(total_pulls, 0, -1):
+            # coins for the pull that ends at n with shift k, for every k
+            coins = [0] * width
+            for k in range(-n, n + 1):
+                positions = [(n * t + k) % size for t, size in zip(turns, sizes)]
+                coins[k + total_pulls] = coins_at(positions, eyes, symbol_count)
+            gained_most = [c + m for c, m in zip(coins, most)]
+            gained_least = [c + m for c, m in zip(coins, least)]
+            # best and worst totals from pull n - 1 on, for every shift
+            most = [0] * width
+            least = [0] * width
+            for k in range(-(n - 1), n):
+                i = k + total_pulls
+                most[i] = max(gained_most[i - 1:i + 2])
+                least[i] = min(gained_least[i - 1:i + 2])
+
+        return '{} {}'.format(most[total_pulls], least[total_pulls])
@@ -1,17 +1,7 @@
 from collections import defaultdict
 import itertools
-import sys
 
 day = 0
 
-if len(sys.argv) != 3:
-    print("invalid command")
-    exit()
-part = int(sys.argv[1])
-sort = sys.argv[2]
-    
-filename = 'input/day{0:02d}/p{1}-{2}.txt'.format(day, part, sort)
-with open(filename, 'r') as file:
-    data = [line.strip() for line in file]
-
-input = data[0]
+def solve(part, data, sort='real'):
+    input = data[0]
@@ -0,0 +1,23 @@
+import unittest
+import os
+import sys
+sys.path.insert(0, os.path.dirname(__file__))
+# the solvers import the shared helpers from the ec package at the root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from day13 import solve
+
+
+class TestMazeDay13(unittest.TestCase):
+    def test_shortest_climb(self):
+        # one step from S onto 9 and one onto E, each level apart counts
+        self.assertEqual(solve(1, ['S9E']), 2 + 2)
+
+    def test_unreachable_end(self):
+        with self.assertRaises(ValueError):
+            solve(1, ['S#E'])
+        with self.assertRaises(ValueError):
+            solve(2, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
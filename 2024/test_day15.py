@@ -0,0 +1,29 @@
+import unittest
+import os
+import sys
+sys.path.insert(0, os.path.dirname(__file__))
+# the solvers import the shared helpers from the ec package at the root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from day15 import solve
+
+
+class TestHerbsDay15(unittest.TestCase):
+    def test_unreachable_herb_is_skipped(self):
+        # the H on the right is walled off, the one below the start is 2 away
+        garden = ['#.#####',
+                  '#...#H#',
+                  '#H#####']
+        self.assertEqual(solve(1, garden), 4)
+
+    def test_no_reachable_herb(self):
+        garden = ['#.###',
+                  '#.#H#',
+                  '#####']
+        with self.assertRaises(ValueError):
+            solve(1, garden)
+        with self.assertRaises(ValueError):
+            solve(2, garden)
+
+
+if __name__ == "__main__":
+    unittest.main()
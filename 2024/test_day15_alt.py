@@ -0,0 +1,18 @@
+import unittest
+import os
+import sys
+sys.path.insert(0, os.path.dirname(__file__))
+# the solvers import the shared helpers from the ec package at the root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from day15_alt import solve
+from ec import io
+
+
+class TestHerbsDay15Alt(unittest.TestCase):
+    def test_example(self):
+        self.assertEqual(solve(1, io.lines('2024', 15, 1, 'test')), 26)
+        self.assertEqual(solve(2, io.lines('2024', 15, 2, 'test')), 38)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+import os
+import sys
+sys.path.insert(0, os.path.dirname(__file__))
+# the solvers import the shared helpers from the ec package at the root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from day18 import solve
+
+
+class TestPalmsDay18(unittest.TestCase):
+    def test_walled_off_palm(self):
+        garden = ['##.####',
+                  '#..P#P#',
+                  '#######']
+        with self.assertRaises(ValueError):
+            solve(1, garden)
+
+    def test_walled_off_cell_is_never_the_best(self):
+        # the '.' right of the wall cannot be reached from the palm
+        garden = ['##.####',
+                  '#.P#.##',
+                  '#######']
+        self.assertEqual(solve(3, garden), 1)
+
+    def test_no_cell_reaches_every_palm(self):
+        with self.assertRaises(ValueError):
+            solve(3, ['##.###', '#P#P.#', '######'])
+
+
+if __name__ == "__main__":
+    unittest.main()
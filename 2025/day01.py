@@ -1,22 +1,10 @@
 from copy import deepcopy
-import sys
 
 # Day identifier used to locate corresponding input files
 day = 1
 
-# Expect two CLI args: part and input variant (e.g. `test` or `real`)
-if len(sys.argv) != 3:
-    print("invalid command")
-    exit()
-part = int(sys.argv[1])
-sort = sys.argv[2]
 
-
-def run(part, sort):
-    # Load input for this day/part/sort
-    filename = 'input/day{0:02d}/p{1}-{2}.txt'.format(day, part, sort)
-    with open(filename, 'r') as file:
-        data = [line.strip() for line in file]
+def solve(part, data, sort='real'):
 
     # Names on a list and a sequence of moves like R3 or L2
     names = data[0].split(',')
@@ -38,12 +26,4 @@ def run(part, sort):
             p %= len(names)
             names[0], names[p] = names[p], names[0]
             p = 0
-    print(f"Part {part}: {names[p]}")
-
-
-if part == 0:
-    run(1, sort)
-    run(2, sort)
-    run(3, sort)
-else:
-    run(part, sort)
\ No newline at end of file
+    return names[p]
@@ -1,14 +1,7 @@
 from copy import deepcopy
-import sys
 
 day = 2
 
-if len(sys.argv) != 3:
-    print("invalid command")
-    exit()
-part = int(sys.argv[1])
-sort = sys.argv[2]
-
 
 def add(x, y):
     # Complex-plane style addition on [real, imag] pairs
@@ -36,11 +29,7 @@ def in_range(P):
     return P[0] > -1000000 and P[0] < 1000000 and P[1] > -1000000 and P[1] < 1000000
 
 
-def run(part, sort):
-    # Load input and parse the anchor point A from the first line
-    filename = 'input/day{0:02d}/p{1}-{2}.txt'.format(day, part, sort)
-    with open(filename, 'r') as file:
-        data = [line.strip() for line in file]
+def solve(part, data, sort='real'):
 
     R = [0, 0]
 
@@ -52,7 +41,7 @@ def run(part, sort):
         R = cycle(R, A, part)
         R = cycle(R, A, part)
         R = cycle(R, A, part)
-        print(f"Part {part}: {R}")
+        return R
     else:
         # For other parts we scan a grid of candidate points and check
         # whether repeated cycles remain in-range; coarser sampling for
@@ -73,12 +62,4 @@ def run(part, sort):
                 if all_in_range:
                     points.add((x, y))
 
-        print(f"Part {part}: {len(points)} points found ({count} checked)")
-
-
-if part == 0:
-    run(1, sort)
-    run(2, sort)
-    run(3, sort)
-else:
-    run(part, sort)
\ No newline at end of file
+        return len(points)
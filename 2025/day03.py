@@ -1,20 +1,10 @@
 from copy import deepcopy
-import sys
 
 # Day identifier for input file selection
 day = 3
 
-if len(sys.argv) != 3:
-    print("invalid command")
-    exit()
-part = int(sys.argv[1])
-sort = sys.argv[2]
 
-
-def run(part, sort):
-    filename = 'input/day{0:02d}/p{1}-{2}.txt'.format(day, part, sort)
-    with open(filename, 'r') as file:
-        data = [line.strip() for line in file]
+def solve(part, data, sort='real'):
 
     # Parse a list of crate sizes and compute unique sizes in descending order
     crates = sorted(list(map(int, data[0].split(','))), reverse=True)
@@ -22,11 +12,11 @@ def run(part, sort):
 
     if part == 1:
         # Sum of all unique crate sizes
-        print(f"Part {part}: {sum(unique_crates)}")
+        return sum(unique_crates)
     elif part == 2:
         # For part 2 take the smallest 20 unique (reverse to ascending first)
         unique_crates.reverse()
-        print(f"Part {part}: {sum(unique_crates[:20])}")
+        return sum(unique_crates[:20])
     elif part == 3:
         # Build successive sets by removing previously-used uniques until none left
         crate_sets = []
@@ -43,12 +33,4 @@ def run(part, sort):
             unique_crates = sorted(set(remaining_crates), reverse=True)
             crate_sets.append(deepcopy(unique_crates))
 
-        print(f"Part {part}: {len(crate_sets)}")
-
-
-if part == 0:
-    run(1, sort)
-    run(2, sort)
-    run(3, sort)
-else:
-    run(part, sort)
\ No newline at end of file
+        return len(crate_sets)
@@ -1,15 +1,8 @@
 from copy import deepcopy
-import sys
-from sympy import ceiling, floor, prod
 from functools import cmp_to_key
 
 day = 5
 
-if len(sys.argv) != 3:
-    print("invalid command")
-    exit()
-part = int(sys.argv[1])
-sort = sys.argv[2]
 
 # A simple tree-like structure: each node (a "bone") can have left/middle/right
 fish = [{'left': None, 'middle': None, 'right': None}]
@@ -59,10 +52,7 @@ def score_fishbone(numbers, part=1):
         return int(''.join(map(str, backbone))), levels
 
 
-def run(part, sort):
-    filename = 'input/day{0:02d}/p{1}-{2}.txt'.format(day, part, sort)
-    with open(filename, 'r') as file:
-        data = [line.strip() for line in file]
+def solve(part, data, sort='real'):
 
     backbone = []
     if part == 1:
@@ -73,7 +63,7 @@ def run(part, sort):
             fish1 = next_element(number, fish1)
         backbone = [bone['middle'] for bone in fish1]
         quality = ''.join(map(str, backbone))
-        print(f"Part {part}: {quality}")
+        return quality
 
     elif part == 2:
         # Evaluate the quality for each sword line and return the range
@@ -82,7 +72,7 @@ def run(part, sort):
             numbers = list(map(int, sword.split(':')[1].split(',')))
             quality = score_fishbone(numbers)
             qualities.append(quality)
-        print(f"Part {part}: {max(qualities) - min(qualities)}")
+        return max(qualities) - min(qualities)
 
     else:
         # For the final part compute a weighted ranking across sword qualities
@@ -94,12 +84,4 @@ def run(part, sort):
         qualities.sort(reverse=True)
 
         result = sum([idx * id for idx, (_, id) in enumerate(qualities, start=1)])
-        print(f"Part {part}: {result}")
-
-
-if part == 0:
-    run(1, sort)
-    run(2, sort)
-    run(3, sort)
-else:
-    run(part, sort)
\ No newline at end of file
+        return result
@@ -1,16 +1,8 @@
 from copy import deepcopy
-import sys
-from sympy import ceiling, floor, prod
 from functools import cmp_to_key
 
 day = 6
 
-if len(sys.argv) != 3:
-    print("invalid command")
-    exit()
-part = int(sys.argv[1])
-sort = sys.argv[2]
-
 
 def find_pairs(knight, novice, data):
     # Count ordered pairs where a knight appears before a novice in the sequence
@@ -60,11 +52,9 @@ def find_pairs_long(knight, novice, data, repeats, width):
     return pairs
 
 
-def run(part, sort):
-    filename = 'input/day{0:02d}/p{1}-{2}.txt'.format(day, part, sort)
-    with open(filename, 'r') as file:
-        # single-line input representing a sequence
-        data = [line.strip() for line in file][0]
+def solve(part, data, sort='real'):
+    # single-line input representing a sequence
+    data = data[0]
 
     pairs = 0
     if part == 1:
@@ -90,13 +80,4 @@ def run(part, sort):
         Cs = find_pairs_long('C', 'c', data, repeats, width)
         pairs += As + Bs + Cs
 
-    print(f"Part {part}: {pairs}")
-
-
-
-if part == 0:
-    run(1, sort)
-    run(2, sort)
-    run(3, sort)
-else:
-    run(part, sort)
\ No newline at end of file
+    return pairs
@@ -1,23 +1,10 @@
 from copy import deepcopy
-import sys
-from time import perf_counter
-from sympy import ceiling, floor, prod
 from functools import cmp_to_key
 
 day = 7
 
-if len(sys.argv) != 3:
-    print("invalid command")
-    exit()
-part = int(sys.argv[1])
-sort = sys.argv[2]
 
-
-def run(part, sort):
-    # Load names and production rules from the input file
-    filename = 'input/day{0:02d}/p{1}-{2}.txt'.format(day, part, sort)
-    with open(filename, 'r') as file:
-        data = [line.strip() for line in file]
+def solve(part, data, sort='real'):
 
     names = data[0].split(',')
     # rules is a mapping from character -> list of allowed following characters
@@ -65,14 +52,12 @@ def run(part, sort):
         memoization[key] = total
         return total
 
-    start = perf_counter()
     result = None
     if part == 1:
         # Find the one valid name that passes the rule check
         for name in names:
             if check_name(name, rules):
                 result = name
-        et1 = perf_counter()
     elif part == 2:
         # Sum indices (1-based) of valid names
         result = 0
@@ -88,14 +73,4 @@ def run(part, sort):
                 total += count_complete_name_optimized(name[-1], len(name), rules)
         result = total
 
-    end = perf_counter()
-
-    print(f"Part {part} ({ceiling((end - start) * 1000000)} micros): \t{result}")
-
-
-if part == 0:
-    run(1, sort)
-    run(2, sort)
-    run(3, sort)
-else:
-    run(part, sort)
\ No newline at end of file
+    return result
@@ -1,37 +1,17 @@
 from collections import defaultdict
 from copy import deepcopy
-import sys
-from time import perf_counter
-from sympy import ceiling, floor, prod
 from functools import cmp_to_key
 
 # Day identifier used to locate input files for this puzzle/day
 day = 8
 
-# The script expects two CLI args: the part number and which input set to use
-# Example usage: `python day08.py 1 test`  or `python day08.py 2 real`
-if len(sys.argv) != 3:
-    print("invalid command")
-    exit()
-# `part` chooses which puzzle/algorithm to run (1, 2 or 3 for this file)
-part = int(sys.argv[1])
-# `sort` chooses which input file variant to use (usually 'test' or 'real')
-sort = sys.argv[2]
 
+def solve(part, data, sort='real'):
+    """Solve the chosen part of the puzzle for the given input lines.
 
-def run(part, sort):
-    """Run the chosen part of the puzzle using the selected input file.
-
-    The input files are expected to live under `input/day{day:02d}` and be
-    named like `p{part}-test.txt` or `p{part}-real.txt`.
+    `data` holds the stripped lines of `input/day{day:02d}/p{part}-{sort}.txt`.
     """
-    filename = 'input/day{0:02d}/p{1}-{2}.txt'.format(day, part, sort)
-    # Read and strip all lines from the input file
-    with open(filename, 'r') as file:
-        data = [line.strip() for line in file]
 
-    # Start a timer (used purely for reporting microseconds later)
-    start = perf_counter()
     result = None
 
     # --- Part 1 ---
@@ -129,16 +109,4 @@ def run(part, sort):
         # The result is the maximum value found among all cuts
         result = max(cuts.values())
 
-    # Stop timing and print result with microsecond precision (rounded up)
-    end = perf_counter()
-
-    print(f"Part {part} ({ceiling((end - start) * 1000000)} micros): \t{result}")
-
-
-if part == 0:
-    # When `part` is 0 run all parts in sequence
-    run(1, sort)
-    run(2, sort)
-    run(3, sort)
-else:
-    run(part, sort)
\ No newline at end of file
+    return result
@@ -1,41 +1,22 @@
 from collections import defaultdict
 from copy import deepcopy
-import sys
-from time import perf_counter
-from sympy import ceiling, floor, prod
 from functools import cmp_to_key
 
-# Day identifier used to locate input files for this puzzle/day
-# This module is a small puzzle solution runner: it parses input files
-# under `input/day{day:02d}` and runs one of three parts (1,2,3).
-# Usage examples (run from the `2025` directory):
-#   python day09.py 1 test   # run part 1 on the 'test' input
-#   python day09.py 2 real   # run part 2 on the 'real' input
+# This module solves one of three parts (1,2,3) for the input files
+# under `input/day{day:02d}`.
+# Usage examples (run from the repository root):
+#   python -m ec run 2025 9 1 test   # run part 1 on the 'test' input
+#   python -m ec run 2025 9 2 real   # run part 2 on the 'real' input
 
 # Day identifier used to locate input files for this puzzle/day
 day = 9
 
-# The script expects two CLI args: the part number and which input set to use
-# Example usage: `python day08.py 1 test`  or `python day08.py 2 real`
-if len(sys.argv) != 3:
-    print("invalid command")
-    exit()
-# `part` chooses which puzzle/algorithm to run (1, 2 or 3 for this file)
-part = int(sys.argv[1])
-# `sort` chooses which input file variant to use (usually 'test' or 'real')
-sort = sys.argv[2]
-
 
-def run(part, sort):
-    """Run the chosen part of the puzzle using the selected input file.
+def solve(part, data, sort='real'):
+    """Solve the chosen part of the puzzle for the given input lines.
 
-    The input files are expected to live under `input/day{day:02d}` and be
-    named like `p{part}-test.txt` or `p{part}-real.txt`.
+    `data` holds the stripped lines of `input/day{day:02d}/p{part}-{sort}.txt`.
     """
-    filename = 'input/day{0:02d}/p{1}-{2}.txt'.format(day, part, sort)
-    # Read and strip all lines from the input file
-    with open(filename, 'r') as file:
-        data = [line.strip() for line in file]
     # Each line in the input is expected to be something like "<id>:<dna>"
     # where <dna> is a sequence (string) of characters. We split on ':'
     # and build a mapping `scales` from integer id -> list(chars of dna).
@@ -111,8 +92,6 @@ def run(part, sort):
             result[child_id] = parent_ables
         return result
 
-    # Start a timer (used purely for reporting microseconds later)
-    start = perf_counter()
     result = None
 
     # --- Part 1 ---
@@ -198,17 +177,4 @@ def run(part, sort):
         largest_family = max(families, key=lambda f: len(f))
         result = sum(largest_family)
         
-    # Stop timing and print result with microsecond precision (rounded up)
-    end = perf_counter()
-
-    # Print the result and elapsed time in microseconds (rounded up).
-    print(f"Part {part} ({ceiling((end - start) * 1000000)} micros): \t{result}")
-
-
-if part == 0:
-    # When `part` is 0 run all parts in sequence
-    run(1, sort)
-    run(2, sort)
-    run(3, sort)
-else:
-    run(part, sort)
\ No newline at end of file
+    return result
@@ -2,76 +2,56 @@ from collections import defaultdict
 from copy import deepcopy
 from filecmp import cmp
 import functools
-import sys
-from time import perf_counter
-from grapheme import length
-from sympy import ceiling, floor, prod
+
+from ec.grid import Grid, KNIGHT
 
 # Day identifier used to locate input files for this puzzle/day
 day = 10
 
-# The script expects two CLI args: the part number and which input set to use
-# Example usage: `python day08.py 1 test`  or `python day08.py 2 real`
-if len(sys.argv) != 3:
-    print("invalid command")
-    exit()
-# `part` chooses which puzzle/algorithm to run (1, 2 or 3 for this file)
-part = int(sys.argv[1])
-# `sort` chooses which input file variant to use (usually 'test' or 'real')
-sort = sys.argv[2]
-
 
-def run(part, sort):
-    """Run the chosen part of the puzzle using the selected input file.
+def solve(part, data, sort='real'):
+    """Solve the chosen part of the puzzle for the given input lines.
 
-    The input files are expected to live under `input/day{day:02d}` and be
-    named like `p{part}-test.txt` or `p{part}-real.txt`.
+    `data` holds the stripped lines of `input/day{day:02d}/p{part}-{sort}.txt`.
     """
-    filename = 'input/day{0:02d}/p{1}-{2}.txt'.format(day, part, sort)
-    # Read and strip all lines from the input file
-    with open(filename, 'r') as file:
-        data = [line.strip() for line in file]
 
-    # Build a 2D grid representation (list of lists of chars) and derive
-    # dimensions. The puzzle uses a grid with symbols:
+    # Build a flat grid with a border wide enough for knight moves. Cells
+    # are addressed by index; moving one row down is `+ grid.stride`.
+    # The puzzle uses a grid with symbols:
     #   'D' = dragon, 'S' = sheep, '#' = hideout, other chars allowed.
-    grid = [list(d) for d in data]
-    R = len(grid)
-    C = len(grid[0])
+    grid = Grid.from_lines(data, fill=ord('.'), border=2)
+    down = grid.stride
 
-    # Create sets of coordinates for quick membership tests. Using sets
+    # Create sets of cell indices for quick membership tests. Using sets
     # makes it easy to compute intersections (e.g., sheep eaten by dragons)
-    dragon = set([(r,c) for r in range(R) for c in range(C) if grid[r][c]=='D'])
-    sheep = set([(r,c) for r in range(R) for c in range(C) if grid[r][c]=='S'])
-    hideouts = set([(r,c) for r in range(R) for c in range(C) if grid[r][c]=='#'])
+    dragon = set(grid.find('D'))
+    sheep = set(grid.find('S'))
+    hideouts = set(grid.find('#'))
 
-    # Start a timer (used purely for reporting microseconds later)
-    start = perf_counter()
     result = None
 
     def reachable_in_1_move(from_positions):
-        """Return set of board coordinates reachable in one knight-like move.
+        """Return set of board indices reachable in one knight-like move.
 
         The movement pattern used here matches chess knight moves: two in
         one direction and one in the other. This helper takes an iterable
-        of coordinate tuples and returns the set of valid coordinates that
-        lie within the grid bounds.
+        of cell indices and returns the set of indices that lie within the
+        grid bounds.
         """
-        moves = [(-2,1), (-2,-1), (2, 1), (2,-1), (1,2), (1,-2), (-1,2), (-1,-2)]
-        possible = set([(r+dr, c+dc) for (r,c) in from_positions for (dr,dc) in moves])
-        # Filter out-of-bounds positions
-        possible = set([(r,c) for (r,c) in possible if 0 <= r < R and 0 <= c < C])
-        return possible
+        moves = grid.offsets(KNIGHT)
+        inside = grid.mask
+        # The border is two cells wide, so i+o never leaves the buffer
+        return set([i+o for i in from_positions for o in moves if inside[i+o]])
     
     def update_sheep(sheep):
         """Move each sheep one row down if possible.
 
         Sheep move downward (increase row index). If a sheep is on the
         bottom row it cannot move further and is dropped (represented by
-        filtering `None` results). The function returns a new set of
-        coordinates for sheep after the move.
+        filtering them out). The function returns a new set of cell
+        indices for sheep after the move.
         """
-        return set([(r+1,c) if r+1 < R else None for (r,c) in sheep]) - set([None])
+        return set([s+down for s in sheep if grid.mask[s+down]])
 
     @functools.cache
     def count_different_moves(sheep, dragon, turn='S'):
@@ -79,7 +59,7 @@ def run(part, sort):
 
         This recursive function counts the number of different game-tree
         paths reachable from the current configuration of `sheep` (a tuple
-        or iterable of coordinates) and the `dragon` coordinate. The
+        or iterable of cell indices) and the `dragon` index. The
         `turn` argument alternates between 'S' (sheep) and 'D' (dragon).
 
         Notes on representation and behavior:
@@ -105,14 +85,14 @@ def run(part, sort):
             move_count = 0
             for idx, s in enumerate(sheep):
                 # If sheep is on the bottom row it cannot move further
-                if s[0]+1 >= R:
+                if not grid.mask[s+down]:
                     move_count += 1
                 # Otherwise, sheep moves down unless the dragon is there
                 # and it's not a hideout. If the move is allowed, recurse
                 # with the updated sheep tuple and switch turn to dragon.
-                elif dragon != (s[0]+1, s[1]) or (s[0]+1, s[1]) in hideouts:
+                elif dragon != s+down or s+down in hideouts:
                     move_count += 1
-                    total += count_different_moves((*sheep[:idx], (s[0]+1, s[1]), *sheep[idx+1:]), dragon, 'D')
+                    total += count_different_moves((*sheep[:idx], s+down, *sheep[idx+1:]), dragon, 'D')
             # If no sheep could move (move_count == 0), the turn passes to dragon
             if move_count == 0: return count_different_moves(sheep, dragon, 'D')
             return total
@@ -169,17 +149,4 @@ def run(part, sort):
         # recomputation over identical states.
         result = count_different_moves(tuple(sheep), dragon.pop(), 'S')
     
-    # Stop timing and print result with microsecond precision (rounded up)
-    end = perf_counter()
-
-    # Print the result and elapsed time in microseconds (rounded up).
-    print(f"Part {part}: ({int(ceiling((end - start) * 1000000)):>12} microseconds): \t{result}")
-
-
-if part == 0:
-    # When `part` is 0 run all parts in sequence
-    run(1, sort)
-    run(2, sort)
-    run(3, sort)
-else:
-    run(part, sort)
\ No newline at end of file
+    return result
@@ -2,33 +2,16 @@ from collections import defaultdict
 from copy import deepcopy
 from filecmp import cmp
 import functools
-import sys
-from time import perf_counter, sleep
-from grapheme import length
-from sympy import ceiling, floor, prod
 
 
 # Day identifier used to locate input files for this puzzle/day
 day = 11
 
 
-# The script expects two CLI args: the part number and which input set to use
-# Example usage: `python day11.py 1 test`  or `python day11.py 2 real`
-if len(sys.argv) != 3:
-    print("invalid command")
-    exit()
+def solve(part, data, sort='real'):
+    """Solve the chosen part of the puzzle for the given input lines.
 
-# `part` chooses which puzzle/algorithm to run (1, 2 or 3 for this file)
-part = int(sys.argv[1])
-# `sort` chooses which input file variant to use (usually 'test' or 'real')
-sort = sys.argv[2]
-
-
-def run(part, sort):
-    """Run the chosen part of the puzzle using the selected input file.
-
-    The input files are expected to live under `input/day{day:02d}` and be
-    named like `p{part}-test.txt` or `p{part}-real.txt`.
+    `data` holds the stripped lines of `input/day{day:02d}/p{part}-{sort}.txt`.
 
     This file implements logic to "equalize" a list of integer columns by
     repeatedly transferring units between adjacent columns until a steady
@@ -40,17 +23,10 @@ def run(part, sort):
       - `determine_steps` combines phase analysis to compute a total step
         count for complete equalization.
 
-    The rest of the function orchestrates reading input, invoking these
-    helpers, and printing timed results for three possible `part` values.
+    The rest of the function orchestrates invoking these helpers and
+    returns the result for three possible `part` values.
     """
 
-    filename = 'input/day{0:02d}/p{1}-{2}.txt'.format(day, part, sort)
-    # Read and strip all lines from the input file
-    with open(filename, 'r') as file:
-        data = [line.strip() for line in file]
-
-    # Start a timer (used purely for reporting microseconds later)
-    start = perf_counter()
     result = None
 
     # Parse the input lines into integers representing column heights
@@ -222,19 +198,4 @@ def run(part, sort):
         # Use the analytical step-determination routine to compute steps
         result = determine_steps(columns)
 
-    # Stop timing and print result with microsecond precision (rounded up)
-    end = perf_counter()
-
-    # Print the result and elapsed time in microseconds (rounded up).
-    print(
-        f"Part {part}: ({int(ceiling((end - start) * 1000000)):>12} microseconds): \t{result}"
-    )
-
-
-if part == 0:
-    # When `part` is 0 run all parts in sequence
-    run(1, sort)
-    run(2, sort)
-    run(3, sort)
-else:
-    run(part, sort)
\ No newline at end of file
+    return result
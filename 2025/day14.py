@@ -1,42 +1,19 @@
 from collections import deque
-import sys
-from time import perf_counter
-from sympy import ceiling
 
 
 # Day identifier used to locate input files for this puzzle/day
 day = 14
 
-# The script expects exactly two CLI args: the part number and which input set
-# to use. Typical usage examples:
-#   python day13.py 1 test    # run part 1 on the 'test' input
-#   python day13.py 2 real    # run part 2 on the 'real' input
-if len(sys.argv) != 3:
-    print("invalid command")
-    exit()
 
-# `part` chooses which puzzle/algorithm to run (1, 2 or 3 for this file)
-part = int(sys.argv[1])
-# `sort` chooses which input file variant to use (usually 'test' or 'real')
-sort = sys.argv[2]
+def solve(part, data, sort='real'):
+    """Solve the selected part for the given input lines.
 
-
-def run(part, sort):
-    """Run the selected part using the given input variant.
-
-    The input file is expected at `input/day{day:02d}/p{part}-{sort}.txt`.
+    `data` holds the stripped lines of `input/day{day:02d}/p{part}-{sort}.txt`.
 
     Note: This function focuses on explaining the algorithm; it intentionally
     does not change the original program's logic.
     """
 
-    # Build the path to the input file and read stripped lines
-    filename = 'input/day{0:02d}/p{1}-{2}.txt'.format(day, part, sort)
-    with open(filename, 'r') as file:
-        data = [line.strip() for line in file]
-
-    # Start a timer to measure elapsed time for this run (reported in microseconds)
-    start = perf_counter()
     result = None
 
     # --- Part 1: return the token at (2025 mod N) ---
@@ -51,15 +28,4 @@ def run(part, sort):
     elif part == 3:
         pass
 
-    # Stop timing and print result with microsecond precision (rounded up)
-    end = perf_counter()
-    print(f"Part {part}: ({int(ceiling((end - start) * 1000000)):>12} microseconds): \t{result}")
-
-
-if part == 0:
-    # Convenience mode: run all parts in sequence
-    run(1, sort)
-    run(2, sort)
-    run(3, sort)
-else:
-    run(part, sort)
\ No newline at end of file
+    return result
@@ -1,8 +1,5 @@
 from collections import deque
 import heapq
-import sys
-from time import perf_counter
-from sympy import ceiling, flatten
 
 
 # Module overview:
@@ -25,36 +22,18 @@ from sympy import ceiling, flatten
 # Day identifier used to locate input files for this puzzle/day
 day = 17
 
-# The script expects exactly two CLI args: the part number and which input set
-# to use. Typical usage examples:
-#   python day13.py 1 test    # run part 1 on the 'test' input
-#   python day13.py 2 real    # run part 2 on the 'real' input
-if len(sys.argv) != 3:
-    print("invalid command")
-    exit()
 
-# `part` chooses which puzzle/algorithm to run (1, 2 or 3 for this file)
-part = int(sys.argv[1])
-# `sort` chooses which input file variant to use (usually 'test' or 'real')
-sort = sys.argv[2]
+def solve(part, data, sort='real'):
+    """Solve the selected part for the given input lines.
 
-
-def run(part, sort):
-    """Run the selected part using the given input variant.
-
-    The input file is expected at `input/day{day:02d}/p{part}-{sort}.txt`.
+    `data` holds the stripped lines of `input/day{day:02d}/p{part}-{sort}.txt`.
 
     Note: This function focuses on explaining the algorithm; it intentionally
     does not change the original program's logic.
     """
 
-    # Build the path to the input file and read stripped lines
-    filename = 'input/day{0:02d}/p{1}-{2}.txt'.format(day, part, sort)
-    with open(filename, 'r') as file:
-        data = [line.strip() for line in file]
-
-    start_pos = flatten([[(i,j) for i, v in enumerate(line) if v=='S'] for j, line in enumerate(data)])
-    origin = flatten([[(i,j) for i, v in enumerate(line) if v=='@'] for j, line in enumerate(data)])
+    start_pos = [c for j, line in enumerate(data) for i, v in enumerate(line) if v=='S' for c in (i, j)]
+    origin = [c for j, line in enumerate(data) for i, v in enumerate(line) if v=='@' for c in (i, j)]
     terrain = [[d for d in line] for line in data]
 
     if start_pos: terrain[start_pos[1]][start_pos[0]] = '0'        
@@ -65,13 +44,11 @@ def run(part, sort):
     # Locate special coordinates in the input grid:
     # - `start_pos`  : coordinates of the 'S' tile (player start)
     # - `origin`     : coordinates of the '@' tile (blast origin)
-    # The nested list comprehensions produce lists of (x,y) tuples; `flatten`
-    # collapses them. The code expects either an empty list or a single
-    # coordinate pair for each of these; the rest of the program indexes
+    # The comprehensions unpack every matching (x,y) into one flat list. The
+    # code expects either an empty list or a single coordinate pair for each
+    # of these; the rest of the program indexes
     # them as `start_pos[0]` = x, `start_pos[1]` = y.
 
-    # Start a timer to measure elapsed time for this run (reported in microseconds)
-    start = perf_counter()
     result = None
 
     def destroyed(R):
@@ -168,15 +145,4 @@ def run(part, sort):
         # Incrementally increase forbidden radius R until a feasible round
         # trip is found that meets the time constraint `max_time`.
 
-    # Stop timing and print result with microsecond precision (rounded up)
-    end = perf_counter()
-    print(f"Part {part}: ({int(ceiling((end - start) * 1000000)):>12} microseconds): \t{result}")
-
-
-if part == 0:
-    # Convenience mode: run all parts in sequence
-    run(1, sort)
-    run(2, sort)
-    run(3, sort)
-else:
-    run(part, sort)
\ No newline at end of file
+    return result
@@ -0,0 +1,10 @@
+"""
+Shared runner for the Everybody Codes solutions.
+
+Every solution module (`2024/dayNN.py`, `2025/dayNN.py`, `story_1/dayNN.py`)
+exposes a `solve(part, data, sort)` function instead of parsing `sys.argv` at
+import time. The registry in `ec.registry` imports those modules by path so a
+single warm process can run any number of solutions:
+
+    python -m ec run 2025 10 3 real
+"""
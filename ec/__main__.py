@@ -0,0 +1,5 @@
+import sys
+
+from ec.cli import main
+
+sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+Parallel batch execution of every (event, day, part, sort) combination.
+
+Jobs are fanned out to a `ProcessPoolExecutor`. Each worker process keeps its
+own registry cache, so a solver module is imported at most once per worker
+no matter how many parts and inputs it runs.
+
+    python -m ec batch --jobs 8 --output report.json
+"""
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import contextlib
+from datetime import datetime, timezone
+import io
+import json
+import os
+import platform
+import signal
+import traceback
+
+from ec import registry, timing
+
+SORTS = ['test', 'real']
+
+
+class JobTimeout(Exception):
+    pass
+
+
+def jobs(event=None, sorts=SORTS):
+    """
+    Returns every (event, day, part, sort) job whose input file exists,
+    ordered by event, day, part and sort.
+    """
+    found = []
+    for ev, day in registry.solvers(event):
+        number, _ = registry.parse_day(day)
+        for part in [1, 2, 3]:
+            for sort in sorts:
+                if os.path.isfile(registry.input_path(ev, number, part, sort)):
+                    found.append((ev, day, part, sort))
+    return found
+
+
+def _raise_timeout(signum, frame):
+    raise JobTimeout()
+
+
+@contextlib.contextmanager
+def time_limit(seconds):
+    """
+    Raises JobTimeout in the body after `seconds`. Uses SIGALRM, so the limit
+    is only enforced on Unix and only in the main thread of a process.
+    """
+    if not seconds or not hasattr(signal, 'SIGALRM'):
+        yield
+        return
+    previous = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.alarm(seconds)
+    try:
+        yield
+    finally:
+        signal.alarm(0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def run_job(job, timeout=None):
+    """
+    Runs a single job and returns its result record. Exceptions, timeouts and
+    anything the solver prints are captured in the record instead of being
+    raised, so one broken day cannot stop a batch.
+
+    Timeouts are only enforced on Unix, see `time_limit`.
+    """
+    event, day, part, sort = job
+    record = {'event': event, 'day': day, 'part': part, 'sort': sort}
+    stdout = io.StringIO()
+    seconds = 0.0
+    try:
+        with time_limit(timeout), contextlib.redirect_stdout(stdout):
+            result, seconds = timing.timed(registry.run, event, day, part, sort)
+        record.update(status='ok', answer=str(result))
+    except JobTimeout:
+        record.update(status='timeout', answer=None)
+        seconds = timeout
+    except Exception as e:
+        record.update(status='error', answer=None, error=''.join(traceback.format_exception_only(type(e), e)).strip())
+
+    record['micros'] = timing.micros(seconds)
+    output = stdout.getvalue()
+    if output:
+        # solvers that print progress can produce a lot of output
+        record['stdout'] = output[-2000:]
+    return record
+
+
+def run_batch(job_list, workers=None, timeout=None, progress=None):
+    """
+    Runs all jobs on a process pool with `workers` processes (default: CPU
+    count) and returns the result records in job order. `progress` is called
+    with every record as soon as it completes.
+    """
+    order = {job: i for i, job in enumerate(job_list)}
+    records = [None] * len(job_list)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run_job, job, timeout): job for job in job_list}
+        for future in as_completed(futures):
+            record = future.result()
+            records[order[futures[future]]] = record
+            if progress:
+                progress(record)
+    return records
+
+
+def report(records, workers=None):
+    """Wraps result records with some information about the run."""
+    return {
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'workers': workers or os.cpu_count(),
+        'results': records,
+    }
+
+
+def write_report(records, path, workers=None):
+    with open(path, 'w') as file:
+        json.dump(report(records, workers), file, indent=2)
+        file.write('\n')
+
+
+def format_record(record):
+    """One line summary of a result record, e.g. for progress output."""
+    label = '{0} day {1} part {2} {3}'.format(record['event'], record['day'], record['part'], record['sort'])
+    if record['status'] == 'ok':
+        return f"{label:<28} ({record['micros']:>12} microseconds): \t{record['answer']}"
+    return f"{label:<28} {record['status'].upper()} {record.get('error', '')}".rstrip()
@@ -0,0 +1,142 @@
+"""
+Benchmarks for every solver with stored baselines.
+
+Each (event, day, part, sort) job is run a few times to warm up and then
+timed `repeats` times. The median and 95th percentile are compared with the
+baseline file, and a job whose median grew by more than `threshold` counts as
+a regression.
+
+    python -m ec bench --save                  # record a new baseline
+    python -m ec bench --event 2024 --day 13   # compare against it
+"""
+import contextlib
+from datetime import datetime, timezone
+import io
+import json
+import math
+import os
+import platform
+import statistics
+
+from ec import batch, registry, timing
+
+BASELINE = os.path.join(registry.ROOT, 'benchmarks', 'baseline.json')
+VERSION = 1
+
+
+def key(job):
+    return '/'.join(str(j) for j in job)
+
+
+def percentile(samples, q):
+    """Nearest rank percentile, `q` between 0 and 100."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def measure(job, warmups=1, repeats=5, timeout=None):
+    """
+    Times a single job and returns a record with its answer and the median,
+    p95 and minimum in microseconds. A job that raises or runs into the
+    timeout gets its status set and no timings.
+    """
+    event, day, part, sort = job
+    samples = []
+    try:
+        with batch.time_limit(timeout), contextlib.redirect_stdout(io.StringIO()):
+            for i in range(warmups + repeats):
+                result, seconds = timing.timed(registry.run, event, day, part, sort)
+                if i >= warmups:
+                    samples.append(seconds)
+    except batch.JobTimeout:
+        return {'status': 'timeout'}
+    except Exception as e:
+        return {'status': 'error', 'error': f'{type(e).__name__}: {e}'}
+
+    return {
+        'status': 'ok',
+        'answer': str(result),
+        'median': timing.micros(statistics.median(samples)),
+        'p95': timing.micros(percentile(samples, 95)),
+        'min': timing.micros(min(samples)),
+    }
+
+
+def run(job_list, warmups=1, repeats=5, timeout=None, progress=None):
+    """
+    Measures all jobs one after the other; running them in parallel would
+    make the timings depend on the load of the other workers.
+    """
+    results = {}
+    for job in job_list:
+        results[key(job)] = measure(job, warmups, repeats, timeout)
+        if progress:
+            progress(job, results[key(job)])
+    return results
+
+
+def load_baseline(path=BASELINE):
+    if not os.path.isfile(path):
+        return {}
+    with open(path) as file:
+        baseline = json.load(file)
+    if baseline.get('version') != VERSION:
+        raise ValueError(f"{path} has baseline version {baseline.get('version')}, expected {VERSION}")
+    return baseline['results']
+
+
+def save_baseline(results, path=BASELINE, merge=True):
+    """
+    Writes the measurements to the baseline file. Jobs that failed are
+    stored with their status only, so `compare` knows they already did. With
+    `merge` the entries of jobs that were not measured this time are kept.
+    """
+    stored = load_baseline(path) if merge else {}
+    stored.update({k: v if v['status'] == 'ok' else {'status': v['status']} for k, v in results.items()})
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as file:
+        json.dump({
+            'version': VERSION,
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'results': dict(sorted(stored.items())),
+        }, file, indent=2)
+        file.write('\n')
+
+
+def compare(results, baseline, threshold=0.25, noise=1000):
+    """
+    Returns a list of (key, reason) for every job that stopped working, got
+    slower than `threshold` (a fraction of the baseline median) or whose
+    answer changed. A job that was already failing in the baseline is only
+    reported once it works again and then regresses.
+    Differences below `noise` microseconds are ignored, the smallest
+    solvers jitter by more than 25% between runs.
+    """
+    problems = []
+    for k, current in results.items():
+        base = baseline.get(k)
+        # a failure counts unless the job already failed in the baseline
+        if current['status'] != 'ok':
+            if base is None or base.get('status', 'ok') == 'ok':
+                problems.append((k, current['status']))
+            continue
+        if base is None or base.get('status', 'ok') != 'ok':
+            continue
+        if current['answer'] != base['answer']:
+            problems.append((k, f"answer changed from {base['answer']} to {current['answer']}"))
+        limit = base['median'] * (1 + threshold)
+        if current['median'] > limit and current['median'] - base['median'] > noise:
+            problems.append((k, f"median {current['median']} us is {current['median'] / base['median']:.2f}x the baseline {base['median']} us"))
+    return problems
+
+
+def format_result(job, result, base=None):
+    label = '{0} day {1} part {2} {3}'.format(*job)
+    if result['status'] != 'ok':
+        return f"{label:<28} {result['status'].upper()} {result.get('error', '')}".rstrip()
+    line = f"{label:<28} median {result['median']:>10} us  p95 {result['p95']:>10} us"
+    if base and base.get('status', 'ok') == 'ok':
+        line += f"  ({result['median'] / base['median']:.2f}x baseline)"
+    return line
@@ -0,0 +1,87 @@
+"""
+Command line entry point.
+
+    python -m ec run 2025 10 3 real    # one part
+    python -m ec run 2024 15_alt 0 test  # part 0 runs parts 1, 2 and 3
+    python -m ec list 2024             # show the registered solvers
+    python -m ec batch --jobs 8        # every solver, part and input on 8 processes
+    python -m ec bench --event 2024    # compare timings with benchmarks/baseline.json
+"""
+import argparse
+
+from ec import batch, bench, registry, timing
+
+
+def run_parts(event, day, part, sort):
+    """Runs one part (or all three for part 0) and prints answer and timing."""
+    for p in ([1, 2, 3] if part == 0 else [part]):
+        result, seconds = timing.timed(registry.run, event, day, p, sort)
+        print(timing.format_part(p, seconds, result))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='ec', description='Everybody Codes solution runner')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='run a single solver')
+    run_parser.add_argument('event', help='event directory, e.g. 2024, 2025 or story_1')
+    run_parser.add_argument('day', help='day number, optionally with a variant suffix such as 15_alt')
+    run_parser.add_argument('part', type=int, choices=[0, 1, 2, 3], help='part to run, 0 runs all parts')
+    run_parser.add_argument('sort', help="input variant, usually 'test' or 'real'")
+
+    list_parser = commands.add_parser('list', help='list registered solvers')
+    list_parser.add_argument('event', nargs='?', help='only list this event')
+
+    batch_parser = commands.add_parser('batch', help='run every solver, part and input on a process pool')
+    batch_parser.add_argument('--jobs', '-j', type=int, default=None, help='number of worker processes, defaults to the CPU count')
+    batch_parser.add_argument('--event', help='only run this event')
+    batch_parser.add_argument('--sort', action='append', choices=batch.SORTS, help='only run this input variant, may be repeated')
+    batch_parser.add_argument('--timeout', type=int, default=None, help='seconds after which a single job is abandoned (Unix only)')
+    batch_parser.add_argument('--output', '-o', default='batch_report.json', help='path of the JSON report')
+
+    bench_parser = commands.add_parser('bench', help='time solvers and compare with the stored baseline')
+    bench_parser.add_argument('--event', help='only benchmark this event')
+    bench_parser.add_argument('--day', help='only benchmark this day, e.g. 13 or 15_alt')
+    bench_parser.add_argument('--sort', action='append', choices=batch.SORTS, help='only benchmark this input variant, may be repeated')
+    bench_parser.add_argument('--warmups', type=int, default=1, help='untimed runs before measuring')
+    bench_parser.add_argument('--repeats', type=int, default=5, help='timed runs per job')
+    bench_parser.add_argument('--timeout', type=int, default=None, help='seconds after which a job is skipped (Unix only)')
+    bench_parser.add_argument('--threshold', type=float, default=0.25, help='allowed slowdown of the median, 0.25 is 25%%')
+    bench_parser.add_argument('--baseline', default=bench.BASELINE, help='path of the baseline file')
+    bench_parser.add_argument('--save', action='store_true', help='store the measurements as the new baseline')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        try:
+            registry.load(args.event, args.day)
+        except KeyError as e:
+            parser.error(e.args[0])
+        run_parts(args.event, args.day, args.part, args.sort)
+    elif args.command == 'list':
+        for event, day in registry.solvers(args.event):
+            print(event, day)
+    elif args.command == 'batch':
+        job_list = batch.jobs(args.event, args.sort or batch.SORTS)
+        if not job_list:
+            parser.error('no inputs found')
+        records = batch.run_batch(job_list, args.jobs, args.timeout, lambda r: print(batch.format_record(r), flush=True))
+        batch.write_report(records, args.output, args.jobs)
+        failed = sum(1 for r in records if r['status'] != 'ok')
+        print(f"{len(records)} jobs, {failed} failed, report written to {args.output}")
+        return 1 if failed else 0
+    elif args.command == 'bench':
+        job_list = [job for job in batch.jobs(args.event, args.sort or batch.SORTS) if args.day is None or job[1] == args.day]
+        if not job_list:
+            parser.error('no inputs found')
+        baseline = bench.load_baseline(args.baseline)
+        results = bench.run(job_list, args.warmups, args.repeats, args.timeout,
+                            lambda job, result: print(bench.format_result(job, result, baseline.get(bench.key(job))), flush=True))
+        if args.save:
+            bench.save_baseline(results, args.baseline)
+            print(f"baseline written to {args.baseline}")
+            return 0
+        problems = bench.compare(results, baseline, args.threshold)
+        for k, reason in problems:
+            print(f"REGRESSION {k}: {reason}")
+        return 1 if problems else 0
@@ -0,0 +1,179 @@
+"""
+Shortest path searches shared by the solutions.
+
+Nodes can be anything hashable; with `ec.grid.Grid` they are cell indices
+and `neighbours` is usually a closure over the grid's offsets.
+"""
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import heapq
+import itertools
+
+from ec.grid import N4
+
+# the total for a target that cannot be reached, the largest array('q') value
+UNREACHABLE = 2**63 - 1
+
+
+def dijkstra(sources, neighbours, cost=None, targets=None):
+    """
+    Dijkstra's algorithm on a binary heap with lazy deletion: improved
+    entries are pushed again and stale ones skipped when popped.
+
+    `sources` is an iterable of start nodes (all at distance 0) or a dict of
+    node -> start distance, so several starts can be seeded at once.
+    `neighbours(node)` yields the successors of a node and
+    `cost(node, next)` returns the weight of that edge (default 1).
+
+    With `targets` the search stops at the first target that is settled and
+    returns (distance, target), or None when no target can be reached.
+    Without targets it returns a dict with the distance of every reachable
+    node.
+    """
+    if not isinstance(sources, dict):
+        sources = dict.fromkeys(sources, 0)
+    targets = set(targets) if targets is not None else None
+
+    distance = dict(sources)
+    # the counter breaks ties so nodes themselves never get compared
+    counter = itertools.count()
+    heap = [(d, next(counter), node) for node, d in sources.items()]
+    heapq.heapify(heap)
+    done = set()
+
+    while heap:
+        d, _, node = heapq.heappop(heap)
+        if node in done:
+            continue
+        done.add(node)
+        if targets is not None and node in targets:
+            return d, node
+        for n in neighbours(node):
+            nd = d + (cost(node, n) if cost else 1)
+            if nd < distance.get(n, nd + 1):
+                distance[n] = nd
+                heapq.heappush(heap, (nd, next(counter), n))
+
+    if targets is not None:
+        return None
+    return distance
+
+
+def bfs_distances(sources, neighbours, targets=None):
+    """
+    Breadth first search with unit edge weights from all `sources` at once.
+    Returns a dict with the number of steps to every reachable node. With
+    `targets` the search stops as soon as all of them have been reached.
+    """
+    distance = dict.fromkeys(sources, 0)
+    remaining = set(targets) - distance.keys() if targets is not None else None
+    queue = deque(distance)
+    while queue and remaining != set():
+        node = queue.popleft()
+        d = distance[node] + 1
+        for n in neighbours(node):
+            if n not in distance:
+                distance[n] = d
+                queue.append(n)
+                if remaining:
+                    remaining.discard(n)
+    return distance
+
+
+def bfs(grid, sources, passable, steps=N4):
+    """
+    Breadth first search over the cells of an `ec.grid.Grid`, starting from
+    all `sources` (cell indices) at once. A cell can be entered when its
+    value is in `passable`; the border value of the grid must not be.
+
+    Returns a dense `array('i')` with the number of steps for every index of
+    the grid, -1 for cells that were not reached.
+    """
+    cells = grid.cells
+    offsets = grid.offsets(steps)
+    visited = grid.layer()
+    distance = array('i', [-1]) * grid.size
+    queue = deque()
+    for s in sources:
+        visited[s] = 1
+        distance[s] = 0
+        queue.append(s)
+    while queue:
+        pos = queue.popleft()
+        d = distance[pos] + 1
+        for o in offsets:
+            n = pos + o
+            if not visited[n] and cells[n] in passable:
+                visited[n] = 1
+                distance[n] = d
+                queue.append(n)
+    return distance
+
+
+def _bfs_sum(grid, sources, passable, targets, steps):
+    cells = grid.cells
+    offsets = grid.offsets(steps)
+    # number the passable cells and list their passable neighbours once,
+    # the searches below then only touch those
+    starts = set(sources)
+    nodes = [i for i in grid.indices() if cells[i] in passable or i in starts]
+    number = {i: k for k, i in enumerate(nodes)}
+    adjacent = [[number[i + o] for o in offsets if cells[i + o] in passable] for i in nodes]
+    totals = [0] * len(nodes)
+    # 1 for cells that at least one of the searches never reaches
+    missed = bytearray(len(nodes))
+    for s in sources:
+        seen = bytearray(len(nodes))
+        frontier = [number[s]]
+        seen[frontier[0]] = 1
+        d = 0
+        while frontier:
+            following = []
+            for n in frontier:
+                totals[n] += d
+                for m in adjacent[n]:
+                    if not seen[m]:
+                        seen[m] = 1
+                        following.append(m)
+            frontier = following
+            d += 1
+        k = seen.find(0)
+        while k >= 0:
+            missed[k] = 1
+            k = seen.find(0, k + 1)
+    result = array('q', [UNREACHABLE]) * len(targets)
+    for k, t in enumerate(targets):
+        n = number.get(t)
+        if n is not None and not missed[n]:
+            result[k] = totals[n]
+    return result
+
+
+def _add_totals(a, b):
+    return UNREACHABLE if a == UNREACHABLE or b == UNREACHABLE else a + b
+
+
+def bfs_sums(grid, sources, passable, targets, steps=N4, workers=1):
+    """
+    For every cell index in `targets`, the sum of its `bfs` distances from
+    each of the `sources` on its own, as an `array('q')` in target order.
+    Targets that one or more of the sources cannot reach get UNREACHABLE,
+    which is larger than any sum, so `min` over the result never picks them.
+
+    With `workers` above 1 the sources are split over a process pool. Every
+    process adds up the distances of its share, so only one total per target
+    comes back from each. Keep the default when the caller already runs in
+    a pool, like `ec batch` and `ec bench` do.
+    """
+    sources = list(sources)
+    targets = list(targets)
+    workers = min(workers, len(sources))
+    if workers <= 1:
+        return _bfs_sum(grid, sources, passable, targets, steps)
+    totals = array('q', [0]) * len(targets)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        shares = [sources[k::workers] for k in range(workers)]
+        for part in pool.map(_bfs_sum, [grid] * workers, shares, [passable] * workers, [targets] * workers, [steps] * workers):
+            totals = array('q', map(_add_totals, totals, part))
+    return totals
@@ -0,0 +1,167 @@
+"""
+Compact rectangular grids.
+
+A `Grid` stores its cells row by row in one flat `bytearray` (or an
+`array` of another type code) and surrounds them with a border of sentinel
+cells. Cells are addressed by a single int index instead of an (x, y) tuple,
+and a neighbour is just `i + offset`. With a border at least as wide as the
+largest step, a neighbour index never leaves the buffer, so hot loops can
+test the sentinel value instead of checking bounds.
+
+    g = Grid.from_lines(data, fill=ord('#'))
+    start = g.index(3, 0)
+    for n in g.neighbours(start):
+        if g[n] != ord('#'):
+            ...
+"""
+from array import array
+
+# (dx, dy) steps; y grows downwards like the row number of the input
+N4 = ((0, -1), (1, 0), (0, 1), (-1, 0))
+N8 = ((0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1))
+KNIGHT = ((-1, -2), (1, -2), (2, -1), (2, 1), (1, 2), (-1, 2), (-2, 1), (-2, -1))
+
+
+class Grid:
+    def __init__(self, width, height, fill=0, border=1, typecode=None):
+        """
+        Creates a `width` x `height` grid with every cell, including the
+        border, set to `fill`. Without a `typecode` the cells are a
+        `bytearray` (values 0..255); otherwise an `array` of that type.
+        """
+        self.width = width
+        self.height = height
+        self.border = border
+        self.stride = width + 2 * border
+        self.size = self.stride * (height + 2 * border)
+        self.fill = fill
+        self.typecode = typecode
+        if typecode is None:
+            self.cells = bytearray([fill]) * self.size
+        else:
+            self.cells = array(typecode, [fill]) * self.size
+        # 1 for cells inside the grid, 0 for the border
+        self.mask = bytearray(self.size)
+        inside = b'\x01' * width
+        for y in range(height):
+            start = self.index(0, y)
+            self.mask[start:start + width] = inside
+        self._offsets = {}
+
+    @classmethod
+    def from_lines(cls, lines, fill=ord('#'), border=1):
+        """
+        Builds a byte grid holding the characters of text lines (or bytes
+        rows). Short lines are padded with `fill`. Use `from_values` for
+        grids of numbers.
+        """
+        width = max((len(line) for line in lines), default=0)
+        grid = cls(width, len(lines), fill, border)
+        for y, line in enumerate(lines):
+            start = grid.index(0, y)
+            grid.cells[start:start + len(line)] = line.encode() if isinstance(line, str) else line
+        return grid
+
+    @classmethod
+    def from_values(cls, rows, fill=0, border=1, typecode='b'):
+        """Builds a grid from rows of numbers, e.g. `[[1, 2], [3, 4]]`."""
+        width = max((len(row) for row in rows), default=0)
+        grid = cls(width, len(rows), fill, border, typecode)
+        for y, row in enumerate(rows):
+            start = grid.index(0, y)
+            grid.cells[start:start + len(row)] = array(grid.cells.typecode, row) if typecode else bytearray(row)
+        return grid
+
+    def index(self, x, y):
+        return (y + self.border) * self.stride + x + self.border
+
+    def coords(self, i):
+        y, x = divmod(i, self.stride)
+        return x - self.border, y - self.border
+
+    def inside(self, i):
+        return self.mask[i] == 1
+
+    def offsets(self, steps=N4):
+        """Index offsets for a sequence of (dx, dy) steps."""
+        key = tuple(steps)
+        if key not in self._offsets:
+            self._offsets[key] = tuple(dy * self.stride + dx for dx, dy in key)
+        return self._offsets[key]
+
+    def neighbours(self, i, steps=N4):
+        """Yields the indices of the neighbours of `i` that lie inside the grid."""
+        mask = self.mask
+        for o in self.offsets(steps):
+            if mask[i + o]:
+                yield i + o
+
+    def indices(self):
+        """Yields the index of every cell inside the grid, row by row."""
+        for y in range(self.height):
+            start = self.index(0, y)
+            yield from range(start, start + self.width)
+
+    def find(self, value):
+        """Returns the indices of all inside cells equal to `value`, row by row."""
+        if isinstance(value, str):
+            value = ord(value)
+        cells = self.cells
+        return [i for i in self.indices() if cells[i] == value]
+
+    def layer(self, fill=0, typecode=None):
+        """
+        A new flat buffer of the same shape, e.g. for distances or a visited
+        bitmap. Returns a `bytearray` without a type code, else an `array`.
+        """
+        if typecode is None:
+            return bytearray([fill]) * self.size
+        return array(typecode, [fill]) * self.size
+
+    def copy(self):
+        other = Grid.__new__(Grid)
+        other.__dict__.update(self.__dict__)
+        other.cells = self.cells[:]
+        return other
+
+    def __getitem__(self, i):
+        return self.cells[i]
+
+    def __setitem__(self, i, value):
+        self.cells[i] = value
+
+    def __len__(self):
+        return self.width * self.height
+
+    def __repr__(self):
+        return 'Grid({0}x{1}, border={2})'.format(self.width, self.height, self.border)
+
+
+def distance_transform(grid, value, diagonal=False):
+    """
+    For every cell equal to `value`, the number of steps to the nearest cell
+    that is not, with everything outside the grid counting as "not". Steps
+    go to the 4 neighbours, or to all 8 with `diagonal`. Other cells are 0.
+
+    Two chamfer passes (forwards and backwards over the rows) give the exact
+    city block or chessboard distance; returns a layer as `array('i')`.
+    """
+    if isinstance(value, str):
+        value = ord(value)
+    cells = grid.cells
+    far = grid.width + grid.height
+    distance = grid.layer(0, 'i')
+    for i in grid.indices():
+        if cells[i] == value:
+            distance[i] = far
+
+    s = grid.stride
+    before = (-s, -1, -s - 1, -s + 1) if diagonal else (-s, -1)
+    after = tuple(-o for o in before)
+    for passes, offsets in ((grid.indices(), before), (reversed(list(grid.indices())), after)):
+        for i in passes:
+            d = distance[i]
+            if d:
+                d = min(d, min(distance[i + o] for o in offsets) + 1)
+                distance[i] = d
+    return distance
@@ -0,0 +1,117 @@
+"""
+Input loading for `<event>/input/dayNN/pP-<sort>.txt`.
+
+Paths are resolved relative to the event directory next to this package,
+never relative to the working directory. Each input file is memory mapped
+once and decoded once per process; `lines` and `grid` hand out fresh
+containers built from the cached data, so a solver may modify what it gets
+without affecting the next part or the next run of a batch.
+
+    from ec import io
+    data = io.lines('2024', 13, 1, 'real')     # stripped str lines
+    rows = io.grid('2024', 13, 1, 'real')      # bytearray rows
+    view = io.raw('2024', 13, 1, 'real')       # memoryview over the mmap
+"""
+import mmap
+import os
+
+# Repository root; the event directories live directly below it
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_maps = {}
+_lines = {}
+
+
+def input_path(event, day, part, sort):
+    """Returns the absolute path of `input/dayNN/pP-sort.txt` for an event."""
+    return os.path.join(ROOT, event, 'input', 'day{0:02d}'.format(day), 'p{0}-{1}.txt'.format(part, sort))
+
+
+def _mapped(event, day, part, sort):
+    """The mmap of an input file, or None for an empty file (those cannot be mapped)."""
+    key = (event, day, part, sort)
+    if key not in _maps:
+        with open(input_path(event, day, part, sort), 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                _maps[key] = None
+            else:
+                _maps[key] = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return _maps[key]
+
+
+def raw(event, day, part, sort):
+    """
+    Returns a read-only memoryview over the memory mapped input file. The
+    mapping is kept open for the lifetime of the process (or until `clear`).
+    """
+    m = _mapped(event, day, part, sort)
+    return memoryview(m) if m is not None else memoryview(b'')
+
+
+def _split(view, strip):
+    # decoding is the one copy of the whole file; str.strip hands back the
+    # line itself when there is nothing to strip
+    text = str(view, 'utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n')
+    result = text.split('\n')
+    if result[-1] == '':
+        result.pop()
+    if strip:
+        result = [line.strip() for line in result]
+    return result
+
+
+def lines(event, day, part, sort, strip=True):
+    """
+    Returns the input as a list of lines. Lines are stripped unless `strip`
+    is False, in which case only the line ending is removed (some puzzles
+    depend on leading spaces).
+    """
+    key = (event, day, part, sort, strip)
+    if key not in _lines:
+        _lines[key] = _split(raw(event, day, part, sort), strip)
+    # a new list of the same cached strings
+    return _lines[key][:]
+
+
+WHITESPACE = b' \t\n\r\x0b\x0c'
+
+
+def grid(event, day, part, sort):
+    """
+    Returns the stripped input lines as mutable `bytearray` rows, copied
+    straight out of the mapped file.
+    """
+    m = _mapped(event, day, part, sort)
+    if m is None:
+        return []
+    view = memoryview(m)
+    rows = []
+    start = 0
+    while start < len(m):
+        end = m.find(b'\n', start)
+        if end < 0:
+            end = len(m)
+        first, last = start, end
+        while first < last and view[first] in WHITESPACE:
+            first += 1
+        while last > first and view[last - 1] in WHITESPACE:
+            last -= 1
+        rows.append(bytearray(view[first:last]))
+        start = end + 1
+    view.release()
+    return rows
+
+
+def clear():
+    """Drops all cached inputs and closes the memory maps."""
+    for m in _maps.values():
+        if m is not None:
+            try:
+                m.close()
+            except BufferError:
+                # a memoryview handed out by raw() is still alive
+                pass
+    _maps.clear()
+    _lines.clear()
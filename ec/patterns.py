@@ -0,0 +1,77 @@
+"""
+Multi-pattern matching with an Aho-Corasick automaton.
+
+All patterns are matched in a single pass over the text, whatever their
+number, so the cost is the length of the text plus the number of patterns'
+characters instead of their product.
+
+    a = Automaton(['THE', 'OWE', 'MES'])
+    a.covered('AWAKEN THE POWER')    # 1 for every character inside a match
+"""
+from collections import deque
+
+
+class Automaton:
+    def __init__(self, patterns):
+        # goto[state] maps a character to the next state; the root is 0
+        self.goto = [{}]
+        fail = [0]
+        # length of the longest pattern that ends in a state
+        self.longest = [0]
+        for pattern in patterns:
+            if not pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                if ch not in self.goto[state]:
+                    self.goto.append({})
+                    fail.append(0)
+                    self.longest.append(0)
+                    self.goto[state][ch] = len(self.goto) - 1
+                state = self.goto[state][ch]
+            self.longest[state] = max(self.longest[state], len(pattern))
+
+        # breadth first, so the fail state of a state is finished before it
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in self.goto[f]:
+                    f = fail[f]
+                fail[nxt] = self.goto[f].get(ch, 0)
+                self.longest[nxt] = max(self.longest[nxt], self.longest[fail[nxt]])
+        self.fail = fail
+
+    def ends(self, text):
+        """
+        Returns a list with, for every position of `text`, the length of the
+        longest pattern that ends there (0 when none does).
+        """
+        goto, fail, longest = self.goto, self.fail, self.longest
+        state = 0
+        result = [0] * len(text)
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            result[i] = longest[state]
+        return result
+
+    def covered(self, text):
+        """
+        Returns a bytearray with a 1 for every position of `text` that lies
+        inside at least one occurrence of a pattern.
+        """
+        ends = self.ends(text)
+        result = bytearray(len(text))
+        # walking backwards, `start` is the leftmost position covered by a
+        # match that ends at or after the current position
+        start = len(text)
+        for i in range(len(text) - 1, -1, -1):
+            if ends[i]:
+                start = min(start, i - ends[i] + 1)
+            if start <= i:
+                result[i] = 1
+        return result
@@ -0,0 +1,89 @@
+"""
+Permutations of positions in a flat buffer.
+
+A `Permutation` is an `array('i')` of source indices: applying it to a
+sequence gives the sequence whose item i is the old item `indices[i]`.
+This is the form a "shuffle the cells of a grid" step naturally comes
+in, and applying one to a flat `str`, `bytes` or `array` is one pass
+without any nested lists.
+
+    step = Permutation([1, 2, 0])
+    step.apply('abc')           # 'bca'
+    (step ** 1000).apply('abc') # 1000 steps, through the cycles of step
+"""
+from array import array
+
+
+class Permutation:
+    def __init__(self, indices):
+        self.indices = array('i', indices)
+
+    @classmethod
+    def identity(cls, n):
+        return cls(range(n))
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __eq__(self, other):
+        return isinstance(other, Permutation) and self.indices == other.indices
+
+    def __repr__(self):
+        return 'Permutation({0})'.format(list(self.indices))
+
+    def apply(self, items):
+        """
+        The items rearranged, as the same type for `str`, `bytes`,
+        `bytearray` and `array`, and as a list otherwise.
+        """
+        picked = map(items.__getitem__, self.indices)
+        if isinstance(items, str):
+            return ''.join(picked)
+        if isinstance(items, (bytes, bytearray)):
+            return type(items)(picked)
+        if isinstance(items, array):
+            return array(items.typecode, picked)
+        return list(picked)
+
+    def __mul__(self, other):
+        """`self` then `other`: (p * q).apply(x) == q.apply(p.apply(x))."""
+        if len(self) != len(other):
+            raise ValueError('permutations of different lengths')
+        return Permutation(map(self.indices.__getitem__, other.indices))
+
+    def inverse(self):
+        inverse = array('i', [0]) * len(self)
+        for i, j in enumerate(self.indices):
+            inverse[j] = i
+        return Permutation(inverse)
+
+    def cycles(self):
+        """The cycles of i -> indices[i], each starting at its smallest index."""
+        indices = self.indices
+        seen = bytearray(len(indices))
+        cycles = []
+        for start in range(len(indices)):
+            if seen[start]:
+                continue
+            cycle = []
+            i = start
+            while not seen[i]:
+                seen[i] = 1
+                cycle.append(i)
+                i = indices[i]
+            cycles.append(cycle)
+        return cycles
+
+    def __pow__(self, n):
+        """
+        The permutation applied n times (any int, negative for the inverse).
+        Every index only moves within its cycle, so this takes one walk over
+        the cycles whatever the size of n.
+        """
+        result = array('i', [0]) * len(self)
+        for cycle in self.cycles():
+            length = len(cycle)
+            shift = n % length
+            for k, i in enumerate(cycle):
+                result[i] = cycle[(k + shift) % length]
+        return Permutation(result)
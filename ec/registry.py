@@ -0,0 +1,107 @@
+"""
+Registry of solver modules.
+
+A solver module is any `dayNN.py` (or `dayNN_<variant>.py`) file inside one
+of the event directories that defines `solve(part, data, sort)`. Modules are
+imported lazily by path and kept for the lifetime of the process, so running
+the same day again (another part, another input) costs no extra imports.
+"""
+import importlib.util
+import os
+import re
+import sys
+
+from ec import io
+from ec.io import ROOT, input_path
+
+# Event directories that hold solver modules
+EVENTS = ['2024', '2025', 'story_1']
+
+# Matches `day07.py` and variants such as `day15_alt.py`
+MODULE_PATTERN = re.compile(r'^day(\d\d)(?:_([a-z]+))?\.py$')
+
+_modules = {}
+
+
+def parse_day(day):
+    """
+    Splits a day argument like `15` or `15_alt` into (15, 'alt').
+    The variant is an empty string for the main solution of a day.
+    """
+    number, _, variant = str(day).partition('_')
+    return int(number), variant
+
+
+def module_name(day, variant=''):
+    """Returns the file stem of a solver module, e.g. `day15_alt`."""
+    return 'day{0:02d}'.format(day) + ('_' + variant if variant else '')
+
+
+def load(event, day):
+    """
+    Imports (once) and returns the solver module for `event` and `day`.
+    Raises KeyError when no such solver exists.
+    """
+    number, variant = parse_day(day)
+    name = module_name(number, variant)
+    key = (event, name)
+    if key in _modules:
+        return _modules[key]
+
+    path = os.path.join(ROOT, event, name + '.py')
+    if not os.path.isfile(path):
+        raise KeyError('no solver for {0} {1}'.format(event, name))
+
+    spec = importlib.util.spec_from_file_location('ec_solvers.{0}.{1}'.format(event, name), path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[spec.name]
+        raise
+    if not hasattr(module, 'solve'):
+        raise KeyError('{0} {1} does not define solve()'.format(event, name))
+
+    _modules[key] = module
+    return module
+
+
+def solvers(event=None):
+    """
+    Returns a sorted list of (event, day) pairs for every solver on disk.
+    `day` is the string accepted by `load`, e.g. `'7'` or `'15_alt'`.
+    """
+    found = []
+    for ev in ([event] if event else EVENTS):
+        directory = os.path.join(ROOT, ev)
+        if not os.path.isdir(directory):
+            continue
+        for filename in sorted(os.listdir(directory)):
+            m = MODULE_PATTERN.match(filename)
+            if not m:
+                continue
+            with open(os.path.join(directory, filename), 'r') as file:
+                if '\ndef solve(' not in file.read():
+                    continue
+            day = str(int(m.group(1))) + ('_' + m.group(2) if m.group(2) else '')
+            found.append((ev, day))
+    return found
+
+
+def read_input(event, day, part, sort, strip=True):
+    """
+    Reads the input lines for one (event, day, part, sort) combination.
+    Lines are stripped unless `strip` is False, in which case only the
+    trailing newline is removed (some puzzles depend on leading spaces).
+    The file is read once per process, see `ec.io`.
+    """
+    number, _ = parse_day(day)
+    return io.lines(event, number, part, sort, strip)
+
+
+def run(event, day, part, sort):
+    """Loads the solver and its input and returns the answer for one part."""
+    module = load(event, day)
+    data = read_input(event, day, part, sort, getattr(module, 'strip_input', True))
+    return module.solve(part, data, sort)
@@ -0,0 +1,62 @@
+"""
+Order statistics without sorting.
+
+`select` is an introselect: quickselect with a median of three pivot that
+falls back to sorting the remaining range when the partitions keep coming
+out lopsided, so it is linear on average and never worse than n log n. It
+works in place on any mutable sequence, typically an `array('q')`.
+"""
+import math
+
+
+def _partition(values, lo, hi):
+    """
+    Hoare partition of values[lo..hi] around a median of three pivot.
+    Returns j such that values[lo..j] <= pivot <= values[j+1..hi].
+    """
+    mid = (lo + hi) // 2
+    a, b, c = values[lo], values[mid], values[hi]
+    pivot = sorted((a, b, c))[1]
+    i, j = lo - 1, hi + 1
+    while True:
+        i += 1
+        while values[i] < pivot:
+            i += 1
+        j -= 1
+        while values[j] > pivot:
+            j -= 1
+        if i >= j:
+            return j
+        values[i], values[j] = values[j], values[i]
+
+
+def select(values, k):
+    """
+    Returns the k-th smallest element (0 based) of `values`. The sequence
+    is reordered in place.
+    """
+    if not 0 <= k < len(values):
+        raise IndexError('select index out of range')
+    lo, hi = 0, len(values) - 1
+    budget = 2 * max(1, int(math.log2(len(values))))
+    while lo < hi:
+        if budget == 0:
+            return sorted(values[lo:hi + 1])[k - lo]
+        budget -= 1
+        j = _partition(values, lo, hi)
+        if k <= j:
+            hi = j
+        else:
+            lo = j + 1
+    return values[k]
+
+
+def median_low(values):
+    """
+    The lower median, like `statistics.median_low`, in linear time. For
+    sums of absolute deviations any value between the two middle elements
+    gives the same total, so this is all that is needed for those.
+    """
+    if not values:
+        raise ValueError('no median for empty data')
+    return select(values, (len(values) - 1) // 2)
@@ -0,0 +1,94 @@
+"""
+Minimum spanning trees for points under the Manhattan distance.
+
+Kruskal over all pairs needs n^2 edges. `manhattan_edges` instead finds,
+for every point and each of the eight 45 degree octants around it, only
+the nearest point in that octant; the minimum spanning tree always uses
+edges from that set, and there are at most 4n of them. The edges are
+found with one sweep over the points per pair of opposite octants.
+
+    tree = manhattan_mst([(1, 1), (3, 2), (8, 8)])    # [(1, 0, 3), (2, 1, 11)]
+"""
+from array import array
+from bisect import bisect_left
+
+
+class DisjointSet:
+    """Union-find over 0..n-1 with union by size and path halving."""
+
+    def __init__(self, n):
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n
+
+    def find(self, x):
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, x, y):
+        """Joins the sets of x and y; returns the new root, or None if they already were one."""
+        x, y = self.find(x), self.find(y)
+        if x == y:
+            return None
+        if self.size[x] < self.size[y]:
+            x, y = y, x
+        self.parent[y] = x
+        self.size[x] += self.size[y]
+        return x
+
+
+def manhattan_edges(points):
+    """
+    Candidate edges (i, j, distance) between the (x, y) `points` that
+    contain a minimum spanning tree.
+    """
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    edges = []
+    for k in range(4):
+        # in this orientation every point is joined to its nearest point
+        # with dx >= dy >= 0 among the points sorted before it
+        order = sorted(range(len(points)), key=lambda i: xs[i] + ys[i])
+        # the active points sorted by -y, with their indices
+        keys = []
+        active = []
+        for i in order:
+            start = bisect_left(keys, -ys[i])
+            end = start
+            while end < len(keys):
+                j = active[end]
+                dx, dy = xs[i] - xs[j], ys[i] - ys[j]
+                if dy > dx:
+                    break
+                edges.append((i, j, dx + dy))
+                end += 1
+            # those points have found their nearest neighbour in this octant
+            del keys[start:end]
+            del active[start:end]
+            if start < len(keys) and keys[start] == -ys[i]:
+                active[start] = i
+            else:
+                keys.insert(start, -ys[i])
+                active.insert(start, i)
+        if k & 1:
+            xs = [-x for x in xs]
+        else:
+            xs, ys = ys, xs
+    return edges
+
+
+def manhattan_mst(points, forest=None):
+    """
+    Kruskal over `manhattan_edges`. Returns the tree edges (i, j, distance)
+    in increasing order of distance. Pass a `DisjointSet` as `forest` to
+    keep the components, e.g. to stop at a maximum distance.
+    """
+    if forest is None:
+        forest = DisjointSet(len(points))
+    tree = []
+    for i, j, d in sorted(manhattan_edges(points), key=lambda edge: edge[2]):
+        if forest.union(i, j) is not None:
+            tree.append((i, j, d))
+    return tree
@@ -0,0 +1,47 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from ec import batch, registry
+
+
+class TestBatch(unittest.TestCase):
+    def test_jobs_only_include_existing_inputs(self):
+        found = batch.jobs('2024', ['test'])
+        self.assertIn(('2024', '1', 1, 'test'), found)
+        self.assertIn(('2024', '15_alt', 3, 'test'), found)
+        self.assertTrue(all(sort == 'test' for _, _, _, sort in found))
+
+    def test_run_job_records_answer(self):
+        record = batch.run_job(('2024', '1', 1, 'test'))
+        self.assertEqual(record['status'], 'ok')
+        self.assertEqual(record['answer'], '5')
+
+    def test_run_job_records_errors(self):
+        def broken(event, day, part, sort):
+            print('about to fail')
+            raise ZeroDivisionError('division by zero')
+
+        with mock.patch.object(registry, 'run', broken):
+            record = batch.run_job(('2024', '1', 1, 'test'))
+        self.assertEqual(record['status'], 'error')
+        self.assertEqual(record['error'], 'ZeroDivisionError: division by zero')
+        self.assertIn('about to fail', record['stdout'])
+
+    def test_run_batch_writes_report(self):
+        job_list = [('2024', '1', p, 'test') for p in [1, 2, 3]]
+        records = batch.run_batch(job_list, workers=2)
+        self.assertEqual([r['answer'] for r in records], ['5', '28', '30'])
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'report.json')
+            batch.write_report(records, path, 2)
+            with open(path) as file:
+                report = json.load(file)
+        self.assertEqual(report['workers'], 2)
+        self.assertEqual(len(report['results']), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+
+from ec import bench
+
+
+class TestBench(unittest.TestCase):
+    def test_percentile(self):
+        samples = list(range(1, 101))
+        self.assertEqual(bench.percentile(samples, 95), 95)
+        self.assertEqual(bench.percentile(samples, 50), 50)
+        self.assertEqual(bench.percentile([3], 95), 3)
+
+    def test_measure(self):
+        result = bench.measure(('2024', '1', 1, 'test'), warmups=1, repeats=3)
+        self.assertEqual(result['status'], 'ok')
+        self.assertEqual(result['answer'], '5')
+        self.assertLessEqual(result['min'], result['median'])
+        self.assertLessEqual(result['median'], result['p95'])
+
+    def test_compare(self):
+        baseline = {
+            'a': {'answer': '1', 'median': 10000},
+            'b': {'answer': '2', 'median': 10000},
+            'c': {'answer': '3', 'median': 10},
+            'f': {'status': 'error'},
+            'g': {'status': 'timeout'},
+        }
+        results = {
+            'a': {'status': 'ok', 'answer': '1', 'median': 12000},
+            'b': {'status': 'ok', 'answer': '2', 'median': 20000},
+            'c': {'status': 'ok', 'answer': '4', 'median': 100},
+            'd': {'status': 'ok', 'answer': '5', 'median': 1},
+            'e': {'status': 'timeout'},
+            'f': {'status': 'error'},
+            'g': {'status': 'ok', 'answer': '7', 'median': 50000},
+            'h': {'status': 'error'},
+        }
+        problems = dict(bench.compare(results, baseline, threshold=0.25))
+        self.assertNotIn('a', problems)
+        self.assertIn('b', problems)
+        # 10 -> 100 microseconds is below the noise floor, the answer is not
+        self.assertIn('answer changed', problems['c'])
+        self.assertNotIn('d', problems)
+        # new failures count, baseline entry or not
+        self.assertEqual(problems['e'], 'timeout')
+        self.assertEqual(problems['h'], 'error')
+        # jobs that already failed in the baseline are not regressions,
+        # neither when they still fail nor when they start working
+        self.assertNotIn('f', problems)
+        self.assertNotIn('g', problems)
+
+    def test_save_and_load_baseline(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'baseline.json')
+            bench.save_baseline({'a': {'status': 'ok', 'answer': '1', 'median': 5}}, path)
+            bench.save_baseline({'b': {'status': 'timeout'}}, path)
+            self.assertEqual(bench.load_baseline(path), {
+                'a': {'status': 'ok', 'answer': '1', 'median': 5},
+                'b': {'status': 'timeout'},
+            })
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+
+from ec import graph
+from ec.grid import Grid
+
+
+class TestGraph(unittest.TestCase):
+    # a line 0 - 1 - 2 - 3 - 4 where stepping onto node 2 is expensive
+    @staticmethod
+    def line(node):
+        return [n for n in (node - 1, node + 1) if 0 <= n <= 4]
+
+    @staticmethod
+    def cost(node, n):
+        return 10 if n == 2 else 1
+
+    def test_all_distances(self):
+        distance = graph.dijkstra([0], self.line, self.cost)
+        self.assertEqual(distance, {0: 0, 1: 1, 2: 11, 3: 12, 4: 13})
+
+    def test_targets_and_multiple_sources(self):
+        self.assertEqual(graph.dijkstra([0, 4], self.line, self.cost, targets=[3]), (1, 3))
+        self.assertEqual(graph.dijkstra({0: 0, 4: 5}, self.line, self.cost, targets=[2, 3]), (6, 3))
+        self.assertIsNone(graph.dijkstra([0], lambda node: [], targets=[4]))
+
+    def test_bfs_distances(self):
+        self.assertEqual(graph.bfs_distances([2], self.line), {2: 0, 1: 1, 3: 1, 0: 2, 4: 2})
+        # stops once every target is reached, node 0 and 4 are never labelled
+        self.assertEqual(graph.bfs_distances([2], self.line, targets=[1, 3]), {2: 0, 1: 1, 3: 1})
+
+    def test_grid_bfs(self):
+        g = Grid.from_lines(['..#', '#..', '...'])
+        distance = graph.bfs(g, [g.index(0, 0)], {ord('.')})
+        self.assertEqual(distance[g.index(2, 2)], 4)
+        self.assertEqual(distance[g.index(2, 0)], -1)
+        self.assertEqual(len(distance), g.size)
+
+    def test_bfs_sums(self):
+        g = Grid.from_lines(['..#.', '#...', '....'])
+        sources = [g.index(0, 0), g.index(3, 2), g.index(3, 0)]
+        targets = [i for i in g.indices() if g[i] == ord('.')]
+        expected = [sum(graph.bfs(g, [s], {ord('.')})[t] for s in sources) for t in targets]
+        self.assertEqual(list(graph.bfs_sums(g, sources, {ord('.')}, targets)), expected)
+        self.assertEqual(list(graph.bfs_sums(g, sources, {ord('.')}, targets, workers=2)), expected)
+
+    def test_bfs_sums_unreachable(self):
+        # (3, 0) is walled off from both sources, (2, 0) is a wall itself
+        g = Grid.from_lines(['..#.', '...#', '....'])
+        sources = [g.index(0, 0), g.index(3, 2)]
+        targets = [g.index(1, 1), g.index(3, 0), g.index(2, 0)]
+        totals = graph.bfs_sums(g, sources, {ord('.')}, targets)
+        self.assertEqual(list(totals), [2 + 3, graph.UNREACHABLE, graph.UNREACHABLE])
+        self.assertEqual(min(totals), 5)
+        # reached from one source only still counts as unreachable
+        self.assertEqual(graph.bfs_sums(g, [g.index(0, 0), g.index(3, 0)], {ord('.')}, [g.index(1, 1)])[0], graph.UNREACHABLE)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+from ec.grid import Grid, KNIGHT, N4, distance_transform
+
+
+class TestGrid(unittest.TestCase):
+    def test_index_and_coords(self):
+        g = Grid.from_lines(['ab', 'cd', 'e'])
+        self.assertEqual((g.width, g.height, g.stride), (2, 3, 4))
+        self.assertEqual(chr(g[g.index(1, 1)]), 'd')
+        self.assertEqual(g.coords(g.index(1, 2)), (1, 2))
+        # short rows are padded with the fill value
+        self.assertEqual(chr(g[g.index(1, 2)]), '#')
+
+    def test_neighbours_stay_inside(self):
+        g = Grid(3, 3)
+        corner = g.index(0, 0)
+        self.assertEqual(sorted(g.coords(n) for n in g.neighbours(corner)), [(0, 1), (1, 0)])
+        self.assertEqual(len(list(g.neighbours(g.index(1, 1)))), 4)
+        k = Grid(5, 5, border=2)
+        self.assertEqual(len(list(k.neighbours(k.index(2, 2), KNIGHT))), 8)
+
+    def test_border_is_sentinel(self):
+        g = Grid.from_values([[1, 2], [3, 4]], fill=-1)
+        values = [g[g.index(0, 0) + o] for o in g.offsets(N4)]
+        self.assertEqual(sorted(values), [-1, -1, 2, 3])
+
+    def test_find_copy_and_layer(self):
+        g = Grid.from_lines(['S.', '.S'])
+        self.assertEqual([g.coords(i) for i in g.find('S')], [(0, 0), (1, 1)])
+        other = g.copy()
+        other[g.index(0, 0)] = ord('.')
+        self.assertEqual(chr(g[g.index(0, 0)]), 'S')
+        self.assertEqual(len(g.layer(0, 'i')), g.size)
+
+    def test_distance_transform(self):
+        g = Grid.from_lines(['#####', '#####', '#####'], fill=ord('.'))
+        straight = distance_transform(g, '#')
+        self.assertEqual([straight[g.index(x, 1)] for x in range(5)], [1, 2, 2, 2, 1])
+        g[g.index(1, 0)] = ord('.')
+        diagonal = distance_transform(g, '#', diagonal=True)
+        self.assertEqual([diagonal[g.index(x, 1)] for x in range(5)], [1, 1, 1, 2, 1])
+        self.assertEqual(diagonal[g.index(1, 0)], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+
+from ec import io
+
+
+class TestIO(unittest.TestCase):
+    def test_lines_are_cached_but_fresh(self):
+        first = io.lines('2024', 1, 1, 'test')
+        self.assertEqual(first, ['ABBAC'])
+        first.append('changed')
+        self.assertEqual(io.lines('2024', 1, 1, 'test'), ['ABBAC'])
+
+    def test_leading_spaces_are_kept(self):
+        stripped = io.lines('2024', 16, 1, 'test')
+        kept = io.lines('2024', 16, 1, 'test', strip=False)
+        self.assertEqual(len(stripped), len(kept))
+        self.assertTrue(any(line.startswith(' ') for line in kept))
+
+    def test_crlf_input(self):
+        # 2025 day 17 inputs use Windows line endings
+        self.assertFalse(any('\r' in line for line in io.lines('2025', 17, 1, 'test', strip=False)))
+        rows = io.grid('2025', 17, 1, 'test')
+        self.assertEqual(rows, [bytearray(line, 'utf-8') for line in io.lines('2025', 17, 1, 'test')])
+
+    def test_grid_and_raw(self):
+        rows = io.grid('2024', 1, 1, 'test')
+        self.assertEqual(rows, [bytearray(b'ABBAC')])
+        rows[0][0] = ord('x')
+        self.assertEqual(io.grid('2024', 1, 1, 'test'), [bytearray(b'ABBAC')])
+        self.assertEqual(bytes(io.raw('2024', 1, 1, 'test')), b'ABBAC')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,19 @@
+import unittest
+
+from ec.patterns import Automaton
+
+
+class TestPatterns(unittest.TestCase):
+    def test_ends_reports_longest_match(self):
+        a = Automaton(['HE', 'SHE', 'HERS'])
+        self.assertEqual(a.ends('USHERS'), [0, 0, 0, 3, 0, 4])
+
+    def test_covered(self):
+        a = Automaton(['THE', 'OWE', 'MES', 'ROD', 'HER'])
+        self.assertEqual(sum(a.covered('AWAKEN THE POWER ADORNED WITH THE FLAMES BRIGHT IRE')), 12)
+        self.assertEqual(list(a.covered('THERE')), [1, 1, 1, 1, 0])
+        self.assertEqual(Automaton([]).covered('ABC'), bytearray(3))
+
+
+if __name__ == "__main__":
+    unittest.main()
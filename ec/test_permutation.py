@@ -0,0 +1,36 @@
+from array import array
+import random
+import unittest
+
+from ec.permutation import Permutation
+
+
+class TestPermutation(unittest.TestCase):
+    def test_apply_keeps_the_type(self):
+        p = Permutation([1, 2, 0])
+        self.assertEqual(p.apply('abc'), 'bca')
+        self.assertEqual(p.apply(b'abc'), b'bca')
+        self.assertEqual(p.apply(array('i', [7, 8, 9])), array('i', [8, 9, 7]))
+        self.assertEqual(p.apply([(0, 0), (0, 1), (1, 0)]), [(0, 1), (1, 0), (0, 0)])
+
+    def test_composition_and_inverse(self):
+        rng = random.Random(19)
+        p = Permutation(rng.sample(range(50), 50))
+        q = Permutation(rng.sample(range(50), 50))
+        text = list(range(100, 150))
+        self.assertEqual((p * q).apply(text), q.apply(p.apply(text)))
+        self.assertEqual(p * p.inverse(), Permutation.identity(50))
+
+    def test_power_matches_repeated_application(self):
+        rng = random.Random(25)
+        p = Permutation(rng.sample(range(30), 30))
+        expected = Permutation.identity(30)
+        for n in range(40):
+            self.assertEqual(p ** n, expected)
+            expected = expected * p
+        self.assertEqual(p ** -1, p.inverse())
+        self.assertEqual((p ** 1048576000).apply('x' * 30), 'x' * 30)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+
+from ec import registry
+
+
+class TestRegistry(unittest.TestCase):
+    def test_parse_day(self):
+        self.assertEqual(registry.parse_day('7'), (7, ''))
+        self.assertEqual(registry.parse_day('15_alt'), (15, 'alt'))
+        self.assertEqual(registry.module_name(15, 'alt'), 'day15_alt')
+
+    def test_solvers_lists_every_event(self):
+        found = registry.solvers()
+        self.assertIn(('2024', '1'), found)
+        self.assertIn(('2024', '15_alt'), found)
+        self.assertIn(('2025', '18'), found)
+        self.assertIn(('story_1', '3'), found)
+        # story_1 day 1 and 2 use their own entry points and are not registered
+        self.assertNotIn(('story_1', '1'), found)
+
+    def test_load_is_cached(self):
+        self.assertIs(registry.load('2024', 1), registry.load('2024', '1'))
+
+    def test_unknown_solver(self):
+        with self.assertRaises(KeyError):
+            registry.load('2024', 99)
+
+    def test_run_examples(self):
+        # Answers for the example inputs shipped with the puzzles
+        self.assertEqual(registry.run('2024', 1, 1, 'test'), 5)
+        self.assertEqual(registry.run('2024', 1, 3, 'test'), 30)
+        self.assertEqual(registry.run('2024', 8, 3, 'test'), 2)
+        self.assertEqual(registry.run('2024', 16, 1, 'test'), '>.- -.- ^,-')
+        self.assertEqual(registry.run('2024', 19, 2, 'test'), 'VICTORY')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+from array import array
+import random
+import statistics
+import unittest
+
+from ec.selection import median_low, select
+
+
+class TestSelection(unittest.TestCase):
+    def test_select_matches_sorting(self):
+        rng = random.Random(4)
+        for n in [1, 2, 3, 10, 101, 1000]:
+            values = [rng.randint(-50, 50) for _ in range(n)]
+            for k in [0, n // 2, n - 1]:
+                self.assertEqual(select(array('q', values), k), sorted(values)[k])
+
+    def test_sorted_and_constant_input(self):
+        self.assertEqual(select(array('q', range(10000)), 1234), 1234)
+        self.assertEqual(select(array('q', [7] * 1000), 500), 7)
+
+    def test_median_low(self):
+        self.assertEqual(median_low(array('q', [5, 1, 4, 2])), statistics.median_low([5, 1, 4, 2]))
+        with self.assertRaises(ValueError):
+            median_low(array('q'))
+
+
+if __name__ == "__main__":
+    unittest.main()
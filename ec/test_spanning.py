@@ -0,0 +1,39 @@
+import itertools
+import random
+import unittest
+
+from ec.spanning import DisjointSet, manhattan_mst
+
+
+def brute_force_weight(points):
+    pairs = sorted(itertools.combinations(range(len(points)), 2),
+                   key=lambda p: abs(points[p[0]][0] - points[p[1]][0]) + abs(points[p[0]][1] - points[p[1]][1]))
+    forest = DisjointSet(len(points))
+    total = 0
+    for i, j in pairs:
+        if forest.union(i, j) is not None:
+            total += abs(points[i][0] - points[j][0]) + abs(points[i][1] - points[j][1])
+    return total
+
+
+class TestSpanning(unittest.TestCase):
+    def test_disjoint_set(self):
+        forest = DisjointSet(5)
+        self.assertIsNotNone(forest.union(0, 1))
+        self.assertIsNotNone(forest.union(3, 1))
+        self.assertIsNone(forest.union(0, 3))
+        self.assertEqual(forest.size[forest.find(3)], 3)
+        self.assertNotEqual(forest.find(2), forest.find(0))
+
+    def test_matches_all_pairs(self):
+        rng = random.Random(17)
+        for n in [1, 2, 5, 40, 200]:
+            # a small field so there are ties and repeated points
+            points = [(rng.randint(0, 15), rng.randint(0, 15)) for _ in range(n)]
+            tree = manhattan_mst(points)
+            self.assertEqual(len(tree), n - 1)
+            self.assertEqual(sum(d for _, _, d in tree), brute_force_weight(points))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+import unittest
+from fractions import Fraction
+
+from ec import timing
+
+
+class TestTiming(unittest.TestCase):
+    def test_micros_rounds_up(self):
+        self.assertEqual(timing.micros(0.0000011), 2)
+        self.assertEqual(timing.micros(0.5), 500000)
+
+    def test_format_part(self):
+        self.assertEqual(timing.format_part(2, 0.25, 42), "Part 2: (      250000 microseconds): \t42")
+
+    def test_timed(self):
+        result, seconds = timing.timed(sum, [1, 2, 3])
+        self.assertEqual(result, 6)
+        self.assertGreaterEqual(seconds, 0)
+
+    def test_exact_prod(self):
+        self.assertEqual(timing.exact_prod([timing.ratio(3, 10), timing.ratio(10, 3)]), 1)
+        self.assertEqual(timing.exact_prod([]), 1)
+        self.assertEqual(timing.floor(Fraction(7, 2)), 3)
+        self.assertEqual(timing.ceiling(Fraction(7, 2)), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,24 @@
+import unittest
+
+from ec import tour
+
+
+def line_distances(positions):
+    return [[abs(a - b) for b in positions] for a in positions]
+
+
+class TestTour(unittest.TestCase):
+    def test_nearest_location_is_not_always_best(self):
+        # start at 0, group A at -5 or 6, group B at 7: picking the closest
+        # A first costs 5 + 12 + 7, going right costs 6 + 1 + 7
+        positions = [0, -5, 6, 7]
+        self.assertEqual(tour.shortest_tour(line_distances(positions), 0, [[1, 2], [3]]), 14)
+
+    def test_groups_on_both_sides(self):
+        positions = [0, -3, 4, -1, 2]
+        self.assertEqual(tour.shortest_tour(line_distances(positions), 0, [[1], [2], [3, 4]]), 14)
+        self.assertEqual(tour.shortest_tour(line_distances(positions), 0, []), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+"""
+Timing and rounding helpers shared by the runner and the solutions.
+
+Everything here is standard library only. The solutions used to import
+`sympy` just for `ceiling`, `floor`, `prod` and `flatten`, which made the
+sympy import the dominant cost of a cold start.
+"""
+from fractions import Fraction
+from functools import reduce
+import math
+import operator
+from time import perf_counter
+
+
+def micros(seconds):
+    """Converts a `perf_counter` delta to whole microseconds, rounded up."""
+    return int(math.ceil(seconds * 1000000))
+
+
+def timed(func, *args, **kwargs):
+    """Calls `func` and returns (result, elapsed seconds)."""
+    start = perf_counter()
+    result = func(*args, **kwargs)
+    return result, perf_counter() - start
+
+
+def format_part(part, seconds, result):
+    """Formats one result line the way the 2025 scripts always printed it."""
+    return f"Part {part}: ({micros(seconds):>12} microseconds): \t{result}"
+
+
+def floor(x):
+    """Rounds down to an int; exact for ints and Fractions."""
+    return math.floor(x)
+
+
+def ceiling(x):
+    """Rounds up to an int; exact for ints and Fractions."""
+    return math.ceil(x)
+
+
+def ratio(numerator, denominator):
+    """Exact rational number numerator / denominator."""
+    return Fraction(numerator, denominator)
+
+
+def exact_prod(values):
+    """
+    Product of ints or Fractions without any float rounding.
+    Returns 1 for an empty sequence, like math.prod.
+    """
+    return reduce(operator.mul, values, Fraction(1))
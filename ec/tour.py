@@ -0,0 +1,173 @@
+"""
+Shortest closed tours that visit one node out of every group.
+
+This is the generalised travelling salesman problem the herb puzzles ask
+for: start somewhere, pick up one herb of every kind and come back. Nodes
+are numbered 0..n-1 and come with a dense distance matrix, e.g. built from
+one `ec.graph.bfs` per node.
+
+The solver is Held-Karp over (visited groups bitmask, current node), run as
+a best-first search. Two things keep it small enough for fifteen groups of
+up to fifty nodes each:
+
+- a lower bound for the rest of a tour from Held-Karp over the groups only,
+  with the closest pair of nodes as the distance between two groups;
+- an upper bound from a good tour found by local search over the group
+  order, which prunes every state that cannot lead to a shorter tour.
+"""
+import heapq
+from operator import add
+
+INF = float('inf')
+
+
+def _prune(dist, nodes, outside):
+    """
+    Drops nodes that are never needed: x is dominated by y when y is at
+    least as close to every node outside its group. Between equal nodes the
+    first one is kept.
+    """
+    keep = []
+    for x in nodes:
+        dx = dist[x]
+        dominated = False
+        for y in nodes:
+            if y == x:
+                continue
+            dy = dist[y]
+            if all(dy[z] <= dx[z] for z in outside) and (y < x or any(dy[z] < dx[z] for z in outside)):
+                dominated = True
+                break
+        if not dominated:
+            keep.append(x)
+    return keep
+
+
+def _group_bounds(dist, start, members):
+    """
+    Held-Karp over the groups only. bound[rest][g] is a lower bound for
+    leaving group g, visiting every group in the bitmask `rest` and
+    returning to start.
+    """
+    count = len(members)
+    between = [[min(dist[x][y] for x in members[g] for y in members[h]) for h in range(count)] for g in range(count)]
+    bound = [None] * (1 << count)
+    bound[0] = [min(dist[x][start] for x in members[g]) for g in range(count)]
+    for rest in range(1, 1 << count):
+        inside = [h for h in range(count) if rest >> h & 1]
+        tail = [bound[rest ^ (1 << h)][h] for h in inside]
+        # only groups outside `rest` are ever asked for
+        bound[rest] = [INF if rest >> g & 1 else min(map(add, map(between[g].__getitem__, inside), tail)) for g in range(count)]
+    return bound
+
+
+def _order_length(order, dist, start, members):
+    """Length of the best tour that visits the groups in this order."""
+    previous = [start]
+    length = [0]
+    for g in order:
+        length = [min(map(add, length, [dist[x][y] for x in previous])) for y in members[g]]
+        previous = members[g]
+    return min(length[i] + dist[x][start] for i, x in enumerate(previous))
+
+
+def _upper_bound(dist, start, members):
+    """
+    A short tour from nearest neighbour order plus moving single groups to
+    another position for as long as that helps.
+    """
+    left = set(range(len(members)))
+    order = []
+    here = [start]
+    while left:
+        g = min(left, key=lambda g: min(dist[x][y] for x in here for y in members[g]))
+        order.append(g)
+        left.remove(g)
+        here = members[g]
+
+    best = _order_length(order, dist, start, members)
+    improved = True
+    while improved:
+        improved = False
+        for i in range(len(order)):
+            for j in range(len(order)):
+                if i == j:
+                    continue
+                candidate = order[:i] + order[i + 1:]
+                candidate.insert(j, order[i])
+                length = _order_length(candidate, dist, start, members)
+                if length < best:
+                    best, order, improved = length, candidate, True
+    return best
+
+
+def shortest_tour(dist, start, groups):
+    """
+    Returns the length of the shortest closed walk from `start` that visits
+    at least one node of every group. `dist` is a square matrix (list of
+    lists) of shortest distances and `groups` a list of node lists.
+    """
+    groups = [list(g) for g in groups if g]
+    if not groups:
+        return 0
+    all_nodes = [x for g in groups for x in g] + [start]
+    members = []
+    for g in groups:
+        inside = set(g)
+        members.append(_prune(dist, g, [z for z in all_nodes if z not in inside]))
+
+    count = len(members)
+    full = (1 << count) - 1
+    bound = _group_bounds(dist, start, members)
+    # closest[x][g]: distance from node x to the nearest node of group g
+    closest = {x: [min(dist[x][y] for y in members[g]) for g in range(count)] for x in all_nodes}
+    # per node and group, the members of the group ordered by distance
+    nearest = {x: [sorted((dist[x][y], y) for y in members[g]) for g in range(count)] for x in all_nodes}
+    best = _upper_bound(dist, start, members)
+
+    # a state is (visited groups, current node); the tour is closed by a
+    # final move back to start with all groups visited
+    heap = [(0, 0, 0, start)]
+    # tails[rest][h]: bound for starting the rest of the tour in group h
+    tails = {}
+    seen = set()
+    cost = {(0, start): 0}
+    while heap:
+        _, c, visited, node = heapq.heappop(heap)
+        c = -c
+        if (visited, node) in seen:
+            continue
+        seen.add((visited, node))
+        if visited == full:
+            if node == start:
+                return c
+            total = c + dist[node][start]
+            if total <= best and total < cost.get((full, start), INF):
+                cost[(full, start)] = total
+                heapq.heappush(heap, (total, -total, full, start))
+            continue
+
+        for g in range(count):
+            if visited >> g & 1:
+                continue
+            now = visited | 1 << g
+            rest = full ^ now
+            if rest:
+                if rest not in tails:
+                    tails[rest] = [bound[rest ^ (1 << h)][h] if rest >> h & 1 else INF for h in range(count)]
+                tail = tails[rest]
+                limit = best - c - bound[rest][g]
+            else:
+                limit = best - c - bound[0][g]
+            for d, y in nearest[node][g]:
+                if d > limit:
+                    break
+                nc = c + d
+                if nc >= cost.get((now, y), INF):
+                    continue
+                estimate = nc + (min(map(add, closest[y], tail)) if rest else dist[y][start])
+                if estimate > best:
+                    continue
+                cost[(now, y)] = nc
+                heapq.heappush(heap, (estimate, -nc, now, y))
+    return best